@@ -1,5 +1,7 @@
 import re
 
+INSTRUMENTED = ("getdigits_part2",)
+
 digits_dict = {
     "one": 1,
     "two": 2,
@@ -44,17 +46,19 @@ def get_number_part2(line):
         return 0
 
 
-if __name__ == '__main__':
+def parse(data: bytes):
+    return data.decode().splitlines()
+
 
-    with open("./input", "r") as f:
-        line = f.readline()
-        i = 0
-        sum_lines_1 = 0
-        sum_lines_2 = 0
+def part1(lines):
+    return sum(get_number_part1(line) for line in lines)
 
-        while line:
-            sum_lines_1 += get_number_part1(line)
-            sum_lines_2 += get_number_part2(line)
-            line = f.readline()
 
-        print(f"Part 1: {sum_lines_1}; part 2: {sum_lines_2}")
\ No newline at end of file
+def part2(lines):
+    return sum(get_number_part2(line) for line in lines)
+
+
+if __name__ == '__main__':
+    with open("./input", "rb") as f:
+        lines = parse(f.read())
+    print(f"Part 1: {part1(lines)}; part 2: {part2(lines)}")
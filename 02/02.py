@@ -2,6 +2,8 @@ from pathlib import Path
 
 from typing import Dict, List
 
+from executor import map_reduce
+
 input_path = Path('./input')
 
 def part1_criterion(game_id, draws: List[Dict]):
@@ -37,12 +39,39 @@ def calculate_power(draws: List[Dict]):
     return reds * blues * greens
 
 
-if __name__ == '__main__':
-    lines = open(input_path).readlines()
+def parse(data: bytes):
+    return [parse_game(x) for x in data.decode().splitlines() if x.strip()]
+
+
+def game_value(game: Dict):
+    return part1_criterion(**game)
+
+
+def game_power(game: Dict):
+    return calculate_power(game['draws'])
+
+
+def part1(games: List[Dict]):
+    return map_reduce(game_value, games)
+
+
+def part2(games: List[Dict]):
+    return map_reduce(game_power, games)
+
+
+def stream(lines):
+    """Fold both parts one game at a time"""
     part_1 = 0
     part_2 = 0
     for x in lines:
-        part_1 += part1_criterion(**parse_game(x))
-        part_2 += calculate_power(parse_game(x)['draws'])
-    print(f'part 1: {part_1}')
-    print(f'part 2: {part_2}')
+        if x.strip():
+            game = parse_game(x)
+            part_1 += part1_criterion(**game)
+            part_2 += calculate_power(game['draws'])
+    return part_1, part_2
+
+
+if __name__ == '__main__':
+    games = parse(input_path.read_bytes())
+    print(f'part 1: {part1(games)}')
+    print(f'part 2: {part2(games)}')
@@ -1,104 +1,65 @@
+import re
 from pathlib import Path
 
+from grid import Grid
+
 input_path = Path("./input")
 
+NOT_SYMBOLS = b"0123456789.\n"
 
-def is_symbol(ch):
-    if ch.isdigit() or ch == ".":
-        return False
-    else:
-        return True
-
-
-def get_number(i, j, lines):
-    """Get full number containing the digit found at i,j"""
-    number = lines[i][j]
-    # to the left
-    k = 1
-    while lines[i][j - k].isdigit():
-        number = lines[i][j - k] + number
-        k += 1
-    # to the right
-    k = 1
-    while lines[i][j + k].isdigit():
-        number = number + lines[i][j + k]
-        k += 1
-    return int(number)
-
-
-def get_surrounding_numbers(i, j, lines):
-    surrounding_numbers = []
-    if lines[i - 1][j].isdigit():
-        surrounding_numbers.append(get_number(i - 1, j, lines))
-    else:
-        if lines[i - 1][j - 1].isdigit():
-            surrounding_numbers.append(get_number(i - 1, j - 1, lines))
-        if lines[i - 1][j + 1].isdigit():
-            surrounding_numbers.append(get_number(i - 1, j + 1, lines))
-    if lines[i][j - 1].isdigit():
-        surrounding_numbers.append(get_number(i, j - 1, lines))
-    if lines[i][j + 1].isdigit():
-        surrounding_numbers.append(get_number(i, j + 1, lines))
-    if lines[i + 1][j].isdigit():
-        surrounding_numbers.append(get_number(i + 1, j, lines))
-    else:
-        if lines[i + 1][j - 1].isdigit():
-            surrounding_numbers.append(get_number(i + 1, j - 1, lines))
-        if lines[i + 1][j + 1].isdigit():
-            surrounding_numbers.append(get_number(i + 1, j + 1, lines))
-    return surrounding_numbers
 
+def is_symbol(ch: int):
+    return ch not in NOT_SYMBOLS
 
-if __name__ == "__main__":
-    raw_lines = open(input_path).readlines()
-    n_rows = len(raw_lines) + 2
-    n_cols = len(raw_lines[0]) + 2
-    lines = ["." * n_cols]
-    for line in raw_lines:
-        lines.append("." + line.strip() + ".")
-    lines.append("." * n_cols)
-
-    part1_sum = 0
-    for i, line in enumerate(lines):
-        if i == 0 or i == n_rows - 1:
-            continue
-        running_number = ""
-        has_symbol = False
-        for j, ch in enumerate(line):
-            if j == 0:
-                continue
-            if not ch.isdigit():
-                if running_number:
-                    if (
-                        is_symbol(lines[i - 1][j])
-                        or is_symbol(lines[i][j])
-                        or is_symbol(lines[i + 1][j])
-                    ):
-                        has_symbol = True
-                if running_number and has_symbol:
-                    part1_sum += int(running_number)
-                running_number = ""
-                if (
-                    is_symbol(lines[i - 1][j])
-                    or is_symbol(lines[i][j])
-                    or is_symbol(lines[i + 1][j])
-                ):
-                    has_symbol = True
-                else:
-                    has_symbol = False
-            if ch.isdigit():
-                running_number += ch
-                if is_symbol(lines[i - 1][j]) or is_symbol(lines[i + 1][j]):
-                    has_symbol = True
-    print(f"part 1: {part1_sum}")
 
+def find_numbers(grid: Grid):
+    """(start, end, value) of every number, start and end as flat indices"""
+    return [
+        (m.start(), m.end(), int(m.group()))
+        for m in re.finditer(rb"\d+", grid.buffer)
+    ]
+
+
+def neighbour_cells(grid: Grid, start, end):
+    """Flat indices of the cells surrounding the span [start, end)"""
+    offsets = grid.offsets()
+    return {k + offset for k in range(start, end) for offset in offsets} - set(
+        range(start, end)
+    )
+
+
+def parse(data: bytes):
+    """Schematic padded with a border of '.' on every side"""
+    return Grid.from_bytes(data).padded(".")
+
+
+def part1(grid: Grid):
+    buffer = grid.buffer
+    return sum(
+        value
+        for start, end, value in find_numbers(grid)
+        if any(is_symbol(buffer[k]) for k in neighbour_cells(grid, start, end))
+    )
+
+
+def part2(grid: Grid):
+    number_at = {}
+    for start, end, value in find_numbers(grid):
+        for k in range(start, end):
+            number_at[k] = (start, value)
+    buffer = grid.buffer
+    offsets = grid.offsets()
     part2_sum = 0
-    for i, line in enumerate(lines):
-        if i == 0 or i == n_rows - 1:
-            continue
-        for j, ch in enumerate(line):
-            if is_symbol(ch):
-                numbers = get_surrounding_numbers(i, j, lines)
-                if len(numbers) == 2:
-                    part2_sum += numbers[0] * numbers[1]
-    print(f"part 2: {part2_sum}")
+    for k, ch in enumerate(buffer):
+        if is_symbol(ch):
+            numbers = {number_at[k + o] for o in offsets if k + o in number_at}
+            if len(numbers) == 2:
+                (_, a), (_, b) = numbers
+                part2_sum += a * b
+    return part2_sum
+
+
+if __name__ == "__main__":
+    grid = parse(input_path.read_bytes())
+    print(f"part 1: {part1(grid)}")
+    print(f"part 2: {part2(grid)}")
@@ -7,17 +7,20 @@ def calculate_intersect_size(card: str):
     return len(intersect)
 
 
-if __name__ == "__main__":
-    lines = open("input").readlines()
+def parse(data: bytes):
+    return [x for x in data.decode().splitlines() if x.strip()]
+
 
+def part1(lines):
     part1_values = [
         2 ** (calculate_intersect_size(line.split(":")[1]) - 1)
         for line in lines
         if calculate_intersect_size(line) > 0
     ]
-    part1_sum = sum(part1_values)
-    print(f"part 1: {part1_sum}")
+    return sum(part1_values)
+
 
+def part2(lines):
     copies = defaultdict(int)
     for line in lines:
         card_number_str, card = line.split(":")
@@ -26,4 +29,49 @@ if __name__ == "__main__":
         intersect_size = calculate_intersect_size(card)
         for i in range(intersect_size):
             copies[card_number + i + 1] += copies[card_number]
-    print(f"part 2: {sum(copies.values())}")
+    return sum(copies.values())
+
+
+def scratchcards(lines):
+    """Yield the part 1 score and the number of cards won so far after each card
+
+    A card only wins copies of the next intersect_size cards, so the copies
+    still to come are kept in a ring buffer with a slot per card offset,
+    grown when a card wins more cards than the ring holds. Memory is
+    O(max matches) however many cards are streamed.
+    """
+    ring = [0]
+    position = 0
+    part1_sum = 0
+    total_cards = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        intersect_size = calculate_intersect_size(line.split(":")[1])
+        if intersect_size >= len(ring):
+            extra = [0] * (intersect_size + 1 - len(ring))
+            ring = ring[position:] + ring[:position] + extra
+            position = 0
+        if intersect_size > 0:
+            part1_sum += 2 ** (intersect_size - 1)
+        card_copies = ring[position] + 1
+        ring[position] = 0
+        total_cards += 1 + card_copies * intersect_size
+        for i in range(1, intersect_size + 1):
+            ring[(position + i) % len(ring)] += card_copies
+        position = (position + 1) % len(ring)
+        yield part1_sum, total_cards
+
+
+def stream(lines):
+    """Fold both parts one card at a time with scratchcards"""
+    part1_sum = total_cards = 0
+    for part1_sum, total_cards in scratchcards(lines):
+        pass
+    return part1_sum, total_cards
+
+
+if __name__ == "__main__":
+    lines = parse(open("input", "rb").read())
+    print(f"part 1: {part1(lines)}")
+    print(f"part 2: {part2(lines)}")
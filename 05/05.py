@@ -1,3 +1,6 @@
+INSTRUMENTED = ("get_mapped_value", "get_mapped_ranges")
+
+
 def get_mapped_value(x, map_list):
     for m in map_list:
         if x < m[1] or x > m[1] + m[2]:
@@ -36,22 +39,28 @@ def get_all_mapped_ranges(range_list, map_list):
     return mapped_ranges 
 
 
-if __name__ == "__main__":
-    with open("input", "r") as f:
-        seeds = [int(x) for x in f.readline().split(':')[1].strip().split()]
-        full_str = f.read()
-        maps = [[[int(z) for z in y.split()] for y in x.split(':')[1].strip().split('\n')] for x in full_str.split('\n\n')]
+def parse(data: bytes):
+    seeds_str, full_str = data.decode().split('\n', 1)
+    seeds = [int(x) for x in seeds_str.split(':')[1].strip().split()]
+    maps = [[[int(z) for z in y.split()] for y in x.split(':')[1].strip().split('\n')] for x in full_str.strip().split('\n\n')]
+    return seeds, maps
+
+
+def part1(almanac):
+    seeds, maps = almanac
     locations = []
     for s in seeds:
         for m in maps:
             s = get_mapped_value(s, m)
         locations.append(s)
-    print(f"part 1: {min(locations)}")
+    return min(locations)
 
-    # part 2
+
+def part2(almanac):
+    seeds, maps = almanac
+    seeds = list(seeds)
+    maps = [sorted(m, key=lambda x: x[1]) for m in maps]
     seed_ranges = []
-    for m in maps:
-        m.sort(key=lambda x: x[1])
     while seeds:
         seed_range_length, seed_range_start = seeds.pop(), seeds.pop()
         seed_ranges.append([seed_range_start, seed_range_length])
@@ -62,4 +71,10 @@ if __name__ == "__main__":
     for m in maps:
         ranges = get_all_mapped_ranges(ranges, m)
 
-    print(f"part 2: {min(x[0] for x in ranges)}")
\ No newline at end of file
+    return min(x[0] for x in ranges)
+
+
+if __name__ == "__main__":
+    almanac = parse(open("input", "rb").read())
+    print(f"part 1: {part1(almanac)}")
+    print(f"part 2: {part2(almanac)}")
\ No newline at end of file
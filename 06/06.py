@@ -11,23 +11,26 @@ def number_of_ways_to_win_2(time, distance):
         - math.ceil((time - math.sqrt(time**2 - 4 * distance)) / 2.0)
     )
 
-if __name__ == "__main__":
+def parse(data: bytes):
+    """Time and distance lines, as lists of number strings"""
+    return [x.split(":")[1].split() for x in data.decode().splitlines() if x.strip()]
+
 
-    # part 1
-    times, distances = [
-        [int(y) for y in x.split(":")[1].strip().split()]
-        for x in open("input").readlines()
-    ]
+def part1(sheet):
+    times, distances = [[int(y) for y in x] for x in sheet]
     races = list(zip(times, distances))
-    part1 = 1
+    result = 1
     for r in races:
-        part1 *= number_of_ways_to_win_1(*r)
-    print(f"part 1: {part1}")
+        result *= number_of_ways_to_win_1(*r)
+    return result
+
 
-    # part 2
-    time, distance = [
-        int(x.split(":")[1].strip().replace(" ", "")) for x in open("input").readlines()
-    ]
+def part2(sheet):
+    time, distance = [int("".join(x)) for x in sheet]
+    return number_of_ways_to_win_2(time, distance)
 
-    part2 = number_of_ways_to_win_2(time, distance)
-    print(f"part 2: {part2}")
+
+if __name__ == "__main__":
+    sheet = parse(open("input", "rb").read())
+    print(f"part 1: {part1(sheet)}")
+    print(f"part 2: {part2(sheet)}")
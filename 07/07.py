@@ -1,5 +1,20 @@
+import heapq
+import struct
+import tempfile
 from collections import Counter
 from functools import cmp_to_key
+from itertools import islice
+
+INSTRUMENTED = ("compare_hands",)
+
+ORDERINGS = {1: "AKQJT98765432", 2: "AKQT98765432J"}
+# hand key (type, cards and input position packed in 64 bits) and bid
+RECORD = struct.Struct("<QQ")
+SEQUENCE_BITS = 40
+RUN_SIZE = 1 << 20
+READ_RECORDS = 4096
+# most runs merged at once, so open files stay few however large the input
+MERGE_FAN_IN = 16
 
 
 def identify_nonjoker_hand_type(c):
@@ -64,23 +79,117 @@ def compare_hands(h1, h2, part):
     return 0
 
 
-if __name__ == "__main__":
-    hands_bids = [x.split() for x in open("input").readlines()]
-
-    # part 1
-    hands_bids.sort(key=cmp_to_key(lambda x1, x2: compare_hands(x1[0], x2[0], part=1)))
-    part1 = 0
-    for i, hand_bid in enumerate(hands_bids, 1):
+def total_winnings(hands_bids, part):
+    ranked = sorted(
+        hands_bids, key=cmp_to_key(lambda x1, x2: compare_hands(x1[0], x2[0], part=part))
+    )
+    winnings = 0
+    for i, hand_bid in enumerate(ranked, 1):
         hand, bid = hand_bid
         bid = int(bid)
-        part1 += i * bid
-    print(f"part 1: {part1}")
+        winnings += i * bid
+    return winnings
 
-    # part 2
-    hands_bids.sort(key=cmp_to_key(lambda x1, x2: compare_hands(x1[0], x2[0], part=2)))
-    part1 = 0
-    for i, hand_bid in enumerate(hands_bids, 1):
-        hand, bid = hand_bid
-        bid = int(bid)
-        part1 += i * bid
-    print(f"part 2: {part1}")
+
+def parse(data: bytes):
+    return [x.split() for x in data.decode().splitlines() if x.strip()]
+
+
+def part1(hands_bids):
+    return total_winnings(hands_bids, part=1)
+
+
+def part2(hands_bids):
+    return total_winnings(hands_bids, part=2)
+
+
+def hand_key(hand, part, sequence=0):
+    """Integer ordered like compare_hands, ties broken by input position"""
+    key = identify_hand_type(hand, part)
+    ordering = ORDERINGS[part]
+    for card in hand:
+        key = key << 4 | (12 - ordering.index(card))
+    return key << SEQUENCE_BITS | sequence
+
+
+def _write_run(records, directory):
+    """Sorted run file holding records, read back from the start"""
+    run = tempfile.TemporaryFile(dir=directory)
+    records = iter(records)
+    while block := list(islice(records, READ_RECORDS)):
+        run.write(b"".join(RECORD.pack(*record) for record in block))
+    run.seek(0)
+    return run
+
+
+def _read_run(run):
+    while block := run.read(READ_RECORDS * RECORD.size):
+        yield from RECORD.iter_unpack(block)
+
+
+def _add_run(runs, run, directory):
+    """Append run to runs, a list of (level, run), merging full levels
+
+    Whenever the last MERGE_FAN_IN runs share a level they are merged into
+    one run of the next level, so at most MERGE_FAN_IN - 1 runs per level
+    stay open.
+    """
+    runs.append((0, run))
+    while len(runs) >= MERGE_FAN_IN and runs[-MERGE_FAN_IN][0] == runs[-1][0]:
+        level = runs[-1][0]
+        full = [run for _, run in runs[-MERGE_FAN_IN:]]
+        del runs[-MERGE_FAN_IN:]
+        merged = _write_run(heapq.merge(*map(_read_run, full)), directory)
+        for run in full:
+            run.close()
+        runs.append((level + 1, merged))
+
+
+def stream(lines, run_size=RUN_SIZE, directory=None):
+    """Rank hands with an external sort, holding at most run_size hands in memory
+
+    Every hand becomes a fixed-width record per part, written out in sorted
+    runs of run_size records, merged MERGE_FAN_IN at a time as they pile up.
+    Merging the part 1 and part 2 runs side by side then yields the hands of
+    both rankings in rank order in a single pass.
+    """
+    runs = {1: [], 2: []}
+    pending = {1: [], 2: []}
+
+    def flush():
+        for part, records in pending.items():
+            records.sort()
+            _add_run(runs[part], _write_run(records, directory), directory)
+            pending[part] = []
+
+    try:
+        sequence = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            hand, bid = line.split()
+            for part, records in pending.items():
+                records.append((hand_key(hand, part, sequence), int(bid)))
+            sequence += 1
+            if sequence % run_size == 0:
+                flush()
+        if pending[1]:
+            flush()
+        winnings = [0, 0]
+        merged = (
+            heapq.merge(*(_read_run(run) for _, run in runs[part])) for part in runs
+        )
+        for rank, ((_, bid1), (_, bid2)) in enumerate(zip(*merged), 1):
+            winnings[0] += rank * bid1
+            winnings[1] += rank * bid2
+        return tuple(winnings)
+    finally:
+        for part_runs in runs.values():
+            for _, run in part_runs:
+                run.close()
+
+
+if __name__ == "__main__":
+    hands_bids = parse(open("input", "rb").read())
+    print(f"part 1: {part1(hands_bids)}")
+    print(f"part 2: {part2(hands_bids)}")
@@ -1,4 +1,4 @@
-def calculate_steps(start_position):
+def calculate_steps(start_position, network, instructions):
     position = start_position
     cursor = 0
     steps = 0
@@ -11,7 +11,7 @@ def calculate_steps(start_position):
     return steps
 
 
-def get_loop(start_position):
+def get_loop(start_position, network, instructions):
     position = start_position
     cursor = 0
     steps = 0
@@ -36,22 +36,34 @@ def get_loop(start_position):
     }
 
 
-if __name__ == "__main__":
-    instructions_str, network_str = open("input").read().split("\n\n")
+def parse(data: bytes):
+    instructions_str, network_str = data.decode().strip().split("\n\n")
     network_dictstr = dict([(x.split(" = ")) for x in network_str.split("\n")])
     network = {k: v.strip("()").split(", ") for k, v in network_dictstr.items()}
-    instructions = [0 if x == "L" else 1 for x in instructions_str]
+    instructions = [0 if x == "L" else 1 for x in instructions_str.strip()]
+    return network, instructions
+
+
+def part1(model):
+    network, instructions = model
+    return calculate_steps("AAA", network, instructions)
 
-    # part 1
-    print(f"part 1: {calculate_steps('AAA')}")
 
-    # part 2
+def part2(model):
+    network, instructions = model
     starter_nodes = [x for x in network.keys() if x[2] == "A"]
 
-    loop_lengths = [get_loop(s)["loop_length"] for s in starter_nodes]
-    part2 = len(instructions)
+    loop_lengths = [
+        get_loop(s, network, instructions)["loop_length"] for s in starter_nodes
+    ]
+    result = len(instructions)
     # some magic happening here.. relies on implicit properties of the input data :-()
     for ll in loop_lengths:
-        part2 *= ll // len(instructions)
+        result *= ll // len(instructions)
+    return result
 
-    print(f"part 2: {part2}")
+
+if __name__ == "__main__":
+    model = parse(open("input", "rb").read())
+    print(f"part 1: {part1(model)}")
+    print(f"part 2: {part2(model)}")
@@ -1,3 +1,6 @@
+from executor import map_reduce
+
+
 def get_prediction(line):
     diff = [line]
     depth = 0
@@ -24,15 +27,31 @@ def get_postdiction(line):
 
 INPUT = "input"
 
-if __name__ == "__main__":
-    lines = [[int(y) for y in x.strip().split()] for x in open(INPUT).readlines()]
+def parse(data: bytes):
+    return [[int(y) for y in x.split()] for x in data.decode().splitlines() if x.strip()]
+
+
+def part1(lines):
+    return map_reduce(get_prediction, lines)
 
-    part1 = 0
-    for line in lines:
-        part1 += get_prediction(line)
-    print(f"part 1: {part1}")
 
+def part2(lines):
+    return map_reduce(get_postdiction, lines)
+
+
+def stream(lines):
+    """Fold both parts one sequence at a time"""
+    part1 = 0
     part2 = 0
-    for line in lines:
-        part2 += get_postdiction(line)
-    print(f"part 2: {part2}")
+    for x in lines:
+        if x.strip():
+            line = [int(y) for y in x.split()]
+            part1 += get_prediction(line)
+            part2 += get_postdiction(line)
+    return part1, part2
+
+
+if __name__ == "__main__":
+    lines = parse(open(INPUT, "rb").read())
+    print(f"part 1: {part1(lines)}")
+    print(f"part 2: {part2(lines)}")
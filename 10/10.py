@@ -1,9 +1,12 @@
+from grid import Grid
+
 INPUT = "input"
+INSTRUMENTED = ("find_next",)
 S_TILE = "|"
 
 
-def find_next(previous, current, lines):
-    tile = lines[current[0]][current[1]]
+def find_next(previous, current, grid: Grid):
+    tile = chr(grid[current])
 
     if tile == "|":
         return (current[0] + current[0] - previous[0], current[1])
@@ -33,38 +36,42 @@ def find_next(previous, current, lines):
         raise Exception()
 
 
-if __name__ == "__main__":
-    lines = [x.strip() for x in open(INPUT).readlines()]
-
-    for i_start, line in enumerate(lines):
-        try:
-            j_start = line.index("S")
-            break
-        except Exception:
-            pass
+def find_loop(grid: Grid):
+    """Walk the pipe loop from S, returning the step count and the set of its tiles"""
+    i_start, j_start = grid.find("S")
 
     previous = (i_start, j_start)
-    current = find_next(previous, (i_start + 1, j_start), lines)
+    current = find_next(previous, (i_start + 1, j_start), grid)
     loop_tiles = {previous, current, (i_start + 1, j_start)}
     previous = (i_start + 1, j_start)
     i = 1
     while current != (i_start, j_start):
         i += 1
-        next = find_next(previous, current, lines)
+        next = find_next(previous, current, grid)
         loop_tiles.add(next)
         previous, current = current, next
+    return i, loop_tiles
+
+
+def parse(data: bytes):
+    return Grid.from_bytes(data)
 
-    print(f"part 1: {i // 2 + 1}")
 
+def part1(grid: Grid):
+    steps, _ = find_loop(grid)
+    return steps // 2 + 1
+
+
+def part2(grid: Grid):
+    _, loop_tiles = find_loop(grid)
     part2 = 0
 
     in_L = 0
     in_F = 0
 
-    for i, line in enumerate(lines):
+    for i in range(grid.n_rows):
         count = 0
-        [pos[1] for pos in loop_tiles if pos[0] == i]
-        for j, c in enumerate(line):
+        for j, c in enumerate(grid.row(i).decode()):
             if c == "S":
                 c = S_TILE
             if (i, j) in loop_tiles:
@@ -88,4 +95,10 @@ if __name__ == "__main__":
                         in_L = 0
             elif count % 2 == 1:
                 part2 += 1
-    print(f"part 2: {part2}")
+    return part2
+
+
+if __name__ == "__main__":
+    grid = parse(open(INPUT, "rb").read())
+    print(f"part 1: {part1(grid)}")
+    print(f"part 2: {part2(grid)}")
@@ -1,9 +1,11 @@
-import numpy as np
+from grid import Grid
 
 INPUT = "input"
 
 
 def expand_space(space):
+    import numpy as np
+
     expansion_rows = []
     # test
     expansion_columns = []
@@ -38,6 +40,8 @@ def distance(pos1, pos2, expansion_rows, expansion_columns, expansion_factor):
 
 
 def sum_distances(space, expansion_factor):
+    import numpy as np
+
     expansion_rows, expansion_columns = expand_space(space)
     running_sum = 0
     for pos1 in np.ndindex(space.shape):
@@ -59,12 +63,20 @@ def sum_distances(space, expansion_factor):
     return running_sum
 
 
+def parse(data: bytes):
+    """uint8 array with 1 for galaxies"""
+    return Grid.from_bytes(data).mask("#")
+
+
+def part1(space):
+    return sum_distances(space, 1)
+
+
+def part2(space):
+    return sum_distances(space, 1000000)
+
+
 if __name__ == "__main__":
-    space = np.array(
-        [
-            list(x.replace(".", "0").replace("#", "1").strip())
-            for x in open(INPUT).readlines()
-        ]
-    ).astype(int)
-    print(f"part 1: {sum_distances(space, 1)}")
-    print(f"part 2: {sum_distances(space, 1000000)}")
+    space = parse(open(INPUT, "rb").read())
+    print(f"part 1: {part1(space)}")
+    print(f"part 2: {part2(space)}")
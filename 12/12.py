@@ -1,6 +1,9 @@
 from functools import cache
 
+from executor import map_reduce
+
 INPUT = "input"
+INSTRUMENTED = ("count_possible_solutions",)
 
 
 def parse_record(rec):
@@ -10,9 +13,7 @@ def parse_record(rec):
 
 
 def unfold(rec):
-    rec[1] = rec[1] * 5
-    rec[0] = "?".join([rec[0]] * 5)
-    return rec
+    return ["?".join([rec[0]] * 5), rec[1] * 5]
 
 
 @cache
@@ -37,19 +38,43 @@ def count_possible_solutions(rec, encoding):
         ) + count_possible_solutions("#" + rec[1:], encoding)
 
 
-if __name__ == "__main__":
-    records = [parse_record(x) for x in open(INPUT).readlines()]
+def parse(data: bytes):
+    return [parse_record(x.strip()) for x in data.decode().splitlines() if x.strip()]
+
+
+def count_record(rec):
+    return count_possible_solutions(rec[0], rec[1])
+
+
+def count_unfolded_record(rec):
+    return count_possible_solutions(*unfold(rec))
 
-    # part 1
-    part1 = 0
-    for rec in records:
-        part1 += count_possible_solutions(rec[0], rec[1])
-    print(f"part 1: {part1}")
 
-    # part 2
+def part1(records):
+    return map_reduce(count_record, records)
+
+
+def part2(records):
+    return map_reduce(count_unfolded_record, records)
+
+
+def stream(lines):
+    """Fold both parts one record at a time
+
+    The cache is emptied after every record so that memory stays flat.
+    """
+    part1 = 0
     part2 = 0
-    for rec in records:
-        unfold(rec)
-        part2 += count_possible_solutions(rec[0], rec[1])
+    for x in lines:
+        if x.strip():
+            rec = parse_record(x.strip())
+            part1 += count_possible_solutions(rec[0], rec[1])
+            part2 += count_possible_solutions(*unfold(rec))
+            count_possible_solutions.cache_clear()
+    return part1, part2
 
-    print(f"part 2: {part2}")
+
+if __name__ == "__main__":
+    records = parse(open(INPUT, "rb").read())
+    print(f"part 1: {part1(records)}")
+    print(f"part 2: {part2(records)}")
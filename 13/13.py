@@ -1,23 +1,24 @@
-import numpy as np
+from functools import partial
+
+from executor import map_reduce
+from grid import Grid
 
 INPUT = "input"
 
 
-def parse(pattern_str):
-    pattern_str = [
-        list(x) for x in pattern_str.replace(".", "0").replace("#", "1").split("\n")
-    ]
-    pattern = np.array(pattern_str, dtype=int)
-    return pattern
+def parse_pattern(pattern_bytes):
+    """uint8 array with 1 for rocks"""
+    return Grid.from_bytes(pattern_bytes).mask("#")
 
 def reflection_criterion(array1, array2, part):
     if part == 1:
         return (array1 == array2).all()
     if part == 2:
-        return np.absolute(array1 - array2).sum() == 1
+        return (array1 != array2).sum() == 1
 
 
-def check_reflections(pattern: np.ndarray, axis: int, part: int) -> bool:
+def check_reflections(pattern, axis: int, part: int) -> bool:
+    """Reflection score of a uint8 NumPy pattern"""
     score = 0
     for axis in [0,1]:
         length = pattern.shape[axis]
@@ -33,18 +34,20 @@ def check_reflections(pattern: np.ndarray, axis: int, part: int) -> bool:
 
 
 
-if __name__ == "__main__":
-    patterns_str = open(INPUT).read().split("\n\n")
-    patterns = [parse(pat) for pat in patterns_str]
+def parse(data: bytes):
+    return [parse_pattern(pat) for pat in data.strip().split(b"\n\n")]
+
 
-    part1 = 0
-    for pat in patterns:
-        part1 += check_reflections(pat, 1, 1)
-    print(f"part1: {part1}")
+def part1(patterns):
+    return map_reduce(partial(check_reflections, axis=1, part=1), patterns)
 
 
-    part2 = 0
-    for pat in patterns:
-        part2 += check_reflections(pat, 1,2)
-    print(f"part2: {part2}")
+def part2(patterns):
+    return map_reduce(partial(check_reflections, axis=1, part=2), patterns)
+
+
+if __name__ == "__main__":
+    patterns = parse(open(INPUT, "rb").read())
+    print(f"part1: {part1(patterns)}")
+    print(f"part2: {part2(patterns)}")
 
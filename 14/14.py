@@ -1,72 +1,71 @@
-from tqdm import tqdm
 from functools import cache
 
+from grid import Grid
+
 INPUT = "input"
+INSTRUMENTED = ("Platform.cycle",)
 
 
-class Line:
-    def __init__(self, line):
-        self.line = "".join(line)
+def roll(line: bytes, reverse: bool = False) -> bytes:
+    """line with its round rocks rolled to the start, or to the end with reverse"""
+    if reverse:
+        return roll(line[::-1])[::-1]
+    previous = None
+    while previous != line:
+        previous, line = line, line.replace(b".O", b"O.")
+    return line
 
-    def tilt_once(self):
-        self.line = self.line.replace(".O", "O.")
 
-    def tilt(self):
-        pretilt = self.line
-        self.tilt_once()
-        while pretilt != self.line:
-            pretilt = self.line
-            self.tilt_once()
+def tilted(grid: Grid, reverse: bool = False) -> Grid:
+    rows = [roll(grid.row(i), reverse) for i in range(grid.n_rows)]
+    return Grid.from_bytes(b"\n".join(rows))
 
-    @property
-    def o_count(self):
-        return self.line.count('O')
 
-    def __repr__(self):
-        return f"Line: {self.line}"
+class Platform:
+    """Platform grid, held by rows or by columns, whichever was tilted last"""
 
+    __slots__ = ("grid", "by_columns")
 
-class Platform:
     def __init__(self, lines):
-        self.lines = [Line(line.strip()) for line in lines.strip().split('\n')]
-        self.cols = list(map(Line, zip(*[line.line for line in self.lines])))
-        self.n_rows = len(self.lines)
-        self.n_cols = len(self.cols)
+        self.grid = Grid.from_bytes(lines.strip().encode())
+        self.by_columns = False
+
+    def _orient(self, by_columns):
+        if self.by_columns != by_columns:
+            self.grid = self.grid.transposed
+            self.by_columns = by_columns
+
+    @property
+    def rows(self) -> Grid:
+        return self.grid.transposed if self.by_columns else self.grid
 
     @property
     def score(self):
+        rows = self.rows
         score = 0
-        for i, line in enumerate(self.lines):
-            score += (platform.n_rows - i) * line.o_count
+        for i in range(rows.n_rows):
+            score += (rows.n_rows - i) * rows.row(i).count(b"O")
         return score
-    
+
     @property
     def big_string(self):
-        return "\n".join([line.line for line in self.lines]) 
+        return bytes(self.rows.buffer).decode()
 
     def tilt_north(self):
-        for col in self.cols:
-            col.tilt()
-        self.lines = list(map(Line, zip(*[cols.line for cols in self.cols])))
+        self._orient(True)
+        self.grid = tilted(self.grid)
 
     def tilt_south(self):
-        for col in self.cols:
-            col.line = col.line[::-1]
-            col.tilt()
-            col.line = col.line[::-1]
-        self.lines = list(map(Line, zip(*[cols.line for cols in self.cols])))
+        self._orient(True)
+        self.grid = tilted(self.grid, reverse=True)
 
     def tilt_west(self):
-        for line in self.lines:
-            line.tilt()
-        self.cols = list(map(Line, zip(*[line.line for line in self.lines])))
+        self._orient(False)
+        self.grid = tilted(self.grid)
 
     def tilt_east(self):
-        for line in self.lines:
-            line.line = line.line[::-1]
-            line.tilt()
-            line.line = line.line[::-1]
-        self.cols = list(map(Line, zip(*[line.line for line in self.lines])))
+        self._orient(False)
+        self.grid = tilted(self.grid, reverse=True)
 
     def cycle(self):
         self.tilt_north()
@@ -75,7 +74,7 @@ class Platform:
         self.tilt_east()
 
     def __repr__(self):
-        return "\n".join([line.line for line in self.lines])
+        return self.big_string
 
 @cache
 def make_100_cycles(platform_str):
@@ -85,17 +84,28 @@ def make_100_cycles(platform_str):
     return platform.big_string, platform.score
 
 
-if __name__ == "__main__":
-    lines = open(INPUT).read()
-    platform = Platform(lines)
+def parse(data: bytes):
+    return data.decode().strip()
+
+
+def part1(platform_str):
+    platform = Platform(platform_str)
     platform.tilt_north()
-    print(f"part1: {platform.score}")
+    return platform.score
+
+
+def part2(platform_str):
+    from tqdm import tqdm
 
-    platform_str = platform.big_string
     for i in tqdm(range(10000000)):
         platform_newstr, score = make_100_cycles(platform_str)
         platform_str = platform_newstr
+    return score
 
-    print(f"part2: {score}")
+
+if __name__ == "__main__":
+    platform_str = parse(open(INPUT, "rb").read())
+    print(f"part1: {part1(platform_str)}")
+    print(f"part2: {part2(platform_str)}")
 
 
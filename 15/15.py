@@ -1,4 +1,7 @@
+from array import array
+
 INPUT = 'input'
+INSTRUMENTED = ('get_value', 'Box.add_lens', 'Box.remove_lens')
 
 def get_value(step):
     current_value = 0
@@ -7,6 +10,8 @@ def get_value(step):
     return current_value
 
 class Lens:
+    __slots__ = ('label', 'focal')
+
     def __init__(self, label, focal):
         self.label = label
         self.focal = int(focal)
@@ -16,36 +21,49 @@ class Lens:
 
 
 class Box:
+    """Lenses kept as a list of labels and a parallel array of focal lengths"""
+    __slots__ = ('boxnum', 'labels', 'focals')
+
     def __init__(self, boxnum):
         self.boxnum = boxnum
-        self.lenses = []
+        self.labels = []
+        self.focals = array('q')
+
+    @property
+    def lenses(self):
+        """Read-only snapshot of the lenses, change them with add_lens and remove_lens"""
+        return tuple(Lens(label, focal) for label, focal in zip(self.labels, self.focals))
 
     def remove_lens(self, label):
-        for lens in self.lenses:
-            if lens.label == label: 
-                self.lenses.remove(lens)
+        if label in self.labels:
+            i = self.labels.index(label)
+            del self.labels[i]
+            del self.focals[i]
 
     def add_lens(self, label, focal):
-        new_lens = Lens(label, focal) 
-        for i in range(len(self.lenses)):
-            if self.lenses[i].label == label: 
-                self.lenses[i] = new_lens
-                return None
-        self.lenses.append(new_lens)
+        if label in self.labels:
+            self.focals[self.labels.index(label)] = int(focal)
+            return None
+        self.labels.append(label)
+        self.focals.append(int(focal))
+
+    def focusing_power(self):
+        return sum((self.boxnum + 1) * focal * (i+1) for i, focal in enumerate(self.focals))
 
     def __repr__(self):
         boxstr = f"Box {self.boxnum} containing {self.lenses}" if self.lenses else ""
         return boxstr
 
 
-if __name__ == '__main__':
-    steps = open(INPUT).read().split(',')
-    
-    #part 1
-    part1 = sum([get_value(step) for step in steps])
-    print(f"part 1: {part1}")
+def parse(data: bytes):
+    return data.decode().strip().split(',')
 
-    #part 2
+
+def part1(steps):
+    return sum([get_value(step) for step in steps])
+
+
+def part2(steps):
     boxes = [Box(label) for label in range(256)]
 
     for step in steps:
@@ -56,8 +74,13 @@ if __name__ == '__main__':
             label, focal = step.split('=')
             boxes[get_value(label)].add_lens(label, focal)
 
-    part2 = sum([(box.boxnum + 1) * lens.focal * (i+1) for box in boxes for i, lens in enumerate(box.lenses)])
-    print(f"part 2: {part2}")
+    return sum(box.focusing_power() for box in boxes)
+
+
+if __name__ == '__main__':
+    steps = parse(open(INPUT, 'rb').read())
+    print(f"part 1: {part1(steps)}")
+    print(f"part 2: {part2(steps)}")
     
 
 
@@ -1,17 +1,48 @@
-from typing import List
+from array import array
+from collections import defaultdict
+from collections.abc import Sequence
+from functools import partial
+from typing import Dict, Optional, Tuple
+
+from executor import map_reduce
 
 INPUT = "input"
+INSTRUMENTED = ("Worflow.apply", "Worflow.accepted_volume")
+RATINGS = "xmas"
+
+# inclusive (low, high) range for each of x, m, a, s
+Box = Tuple[Tuple[int, int], ...]
+
+
+def make_box(low: int = 1, high: int = 4000) -> Box:
+    return tuple((low, high) for _ in RATINGS)
+
+
+def volume(box: Box) -> int:
+    result = 1
+    for low, high in box:
+        result *= high - low + 1
+    return result
 
 
 class Part:
+    """Ratings of one part as an (x, m, a, s) tuple"""
+
+    __slots__ = ("ratings",)
+
     def __init__(self, part_str: str):
-        self.ratings = {
-            k: int(v)
-            for k, v in dict(
-                [x.split("=") for x in part_str.strip("{}").split(",")]
-            ).items()
-        }
-        self.value = sum(self.ratings.values())
+        ratings = dict(x.split("=") for x in part_str.strip("{}").split(","))
+        self.ratings = tuple(int(ratings[rating]) for rating in RATINGS)
+
+    @classmethod
+    def from_ratings(cls, ratings) -> "Part":
+        part = cls.__new__(cls)
+        part.ratings = tuple(ratings)
+        return part
+
+    @property
+    def value(self) -> int:
+        return sum(self.ratings)
 
     def apply(self, workflows):
         dest = "in"
@@ -20,26 +51,73 @@ class Part:
         return dest
 
     def __repr__(self):
-        return f"Part: {self.ratings}"
+        return f"Part: {dict(zip(RATINGS, self.ratings))}"
+
+
+class PartArray(Sequence):
+    """Parts stored as one flat array of ratings, len(parts) rows of (x, m, a, s)
+
+    Indexing builds a Part on the fly and slicing returns another PartArray,
+    so the parts cost 32 bytes each at rest and chunks of them stay compact
+    when sent to other processes.
+    """
+
+    __slots__ = ("ratings",)
+
+    def __init__(self, ratings=None):
+        self.ratings = array("q") if ratings is None else ratings
+
+    @classmethod
+    def from_parts(cls, parts) -> "PartArray":
+        result = cls()
+        for part in parts:
+            result.append(part)
+        return result
+
+    def append(self, part: Part):
+        self.ratings.extend(part.ratings)
+
+    def __len__(self):
+        return len(self.ratings) // len(RATINGS)
+
+    def __getitem__(self, i):
+        n = len(RATINGS)
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step == 1:
+                return PartArray(self.ratings[n * start : n * stop])
+            return PartArray.from_parts(self[j] for j in range(start, stop, step))
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("part index out of range")
+        return Part.from_ratings(self.ratings[n * i : n * i + n])
+
+    def __repr__(self):
+        return f"PartArray of {len(self)} parts"
 
 
 class Rule:
+    __slots__ = ("str", "criterion", "dest", "rating", "index", "comp", "value")
+
     def __init__(self, rule_str: str):
+        self.str = rule_str
         if ":" in rule_str:
-            self.str = rule_str
             self.criterion, self.dest = rule_str.split(":")
             self.rating, self.comp, self.value = (
                 self.criterion[0],
                 self.criterion[1],
                 int(self.criterion[2:]),
             )
+            self.index = RATINGS.index(self.rating)
         else:
             self.criterion = None
             self.dest = rule_str
+            self.rating = self.comp = self.value = self.index = None
 
     def apply(self, part: Part):
         if self.criterion:
-            value = part.ratings[self.rating]
+            value = part.ratings[self.index]
             if self.comp == ">":
                 return value > self.value
             if self.comp == "<":
@@ -47,9 +125,20 @@ class Rule:
         else:
             return True
 
-    def reverse(self):
-        reversed_rule = Rule(self.str.replace(">", "(").replace("<", ")"))
-        return reversed_rule
+    def split(self, box: Box) -> Tuple[Optional[Box], Optional[Box]]:
+        """Split box into the part matching this rule and the part falling through"""
+        if not self.criterion:
+            return box, None
+        i = self.index
+        low, high = box[i]
+        if self.comp == ">":
+            matched, rest = (max(low, self.value + 1), high), (low, min(high, self.value))
+        else:
+            matched, rest = (low, min(high, self.value - 1)), (max(low, self.value), high)
+        return (
+            box[:i] + (matched,) + box[i + 1 :] if matched[0] <= matched[1] else None,
+            box[:i] + (rest,) + box[i + 1 :] if rest[0] <= rest[1] else None,
+        )
 
     def __repr__(self):
         return (
@@ -58,6 +147,8 @@ class Rule:
 
 
 class Worflow:
+    __slots__ = ("name", "rules")
+
     def __init__(self, workflow_str: str):
         self.name, rules_str = workflow_str.strip("}").split("{")
         self.rules = [Rule(rule) for rule in rules_str.split(",")]
@@ -67,29 +158,42 @@ class Worflow:
             if rule.apply(part):
                 return rule.dest
 
-    def rules_that_win(self, rules=List[Rule]):
-        winning_rules = []
-        agg_rules = rules
-        for r in self.rules:
-            if r.criterion:
-                if r.dest == "A":
-                    winning_rules.append(agg_rules + [r])
-                    agg_rules.append(r.reverse())
-                elif r.dest == "R":
-                    agg_rules.append(r.reverse())
-                else:
-                    winning_rules.extend(
-                        workflows[r.dest].rules_that_win(agg_rules + [r])
+    def accepts(self, part: Part, workflows: Dict, memo: Dict) -> bool:
+        """Whether part ends up accepted once it reaches this workflow
+
+        memo maps each workflow name to its known outcomes by ratings.
+        """
+        known = memo.setdefault(self.name, {})
+        if part.ratings not in known:
+            dest = self.apply(part)
+            known[part.ratings] = dest == "A" or (
+                dest != "R" and workflows[dest].accepts(part, workflows, memo)
+            )
+        return known[part.ratings]
+
+    def accepted_volume(self, box: Box, workflows: Dict, memo: Dict) -> int:
+        """Number of rating combinations within box that end up accepted
+
+        memo maps each workflow name to its known volumes by box.
+        """
+        known = memo.setdefault(self.name, {})
+        key = box
+        if key in known:
+            return known[key]
+        total = 0
+        for rule in self.rules:
+            matched, box = rule.split(box)
+            if matched is not None:
+                if rule.dest == "A":
+                    total += volume(matched)
+                elif rule.dest != "R":
+                    total += workflows[rule.dest].accepted_volume(
+                        matched, workflows, memo
                     )
-                    agg_rules.append(r.reverse())
-            else:
-                if r.dest == "A":
-                    winning_rules.append(agg_rules)
-                elif r.dest == "R":
-                    pass
-                else:
-                    winning_rules.extend(workflows[r.dest].rules_that_win(agg_rules))
-        return winning_rules
+            if box is None:
+                break
+        known[key] = total
+        return total
 
     def __repr__(self):
         return f"""
@@ -98,43 +202,99 @@ Rules:
 {self.rules}"""
 
 
-class Criteria:
-    def __init__(self, rules=List[Rule]):
-        self.criteria = [r.criterion for r in rules]
+def count_accepted(workflows: Dict, low: int = 1, high: int = 4000) -> int:
+    """Count rating combinations with every rating in [low, high] that get accepted"""
+    return workflows["in"].accepted_volume(make_box(low, high), workflows, {})
 
-    def count_possible(self, c: chr):
-        c_min = max(
-            [int(x[2:]) + 1 for x in self.criteria if x[:2] == c + ">"]
-            + [int(x[2:]) for x in self.criteria if x[:2] == c + ")"]
-            + [1]
-        )
-        c_max = min(
-            [int(x[2:]) - 1 for x in self.criteria if x[:2] == c + "<"]
-            + [int(x[2:]) for x in self.criteria if x[:2] == c + "("]
-            + [4000]
+
+class IncrementalSystem:
+    """Workflows and parts re-scored incrementally as workflows are edited
+
+    Outcomes of parts and accepted volumes are cached per workflow, and only
+    depend on the workflows downstream. Editing a workflow therefore only
+    drops the caches of the workflows that can route to it, found through
+    the callers graph, and re-scoring recomputes just those.
+    """
+
+    def __init__(self, workflows: Dict, parts):
+        self.workflows = dict(workflows)
+        self.parts = parts
+        self.callers = defaultdict(set)
+        for workflow in self.workflows.values():
+            self._link(workflow)
+        self.outcomes = {}
+        self.volumes = {}
+
+    def _link(self, workflow: Worflow, unlink: bool = False):
+        for rule in workflow.rules:
+            if rule.dest not in ("A", "R"):
+                if unlink:
+                    self.callers[rule.dest].discard(workflow.name)
+                else:
+                    self.callers[rule.dest].add(workflow.name)
+
+    def upstream(self, name: str):
+        """name and every workflow that can route parts to it"""
+        found = {name}
+        pending = [name]
+        while pending:
+            for caller in self.callers[pending.pop()]:
+                if caller not in found:
+                    found.add(caller)
+                    pending.append(caller)
+        return found
+
+    def edit(self, workflow_str: str):
+        """Replace (or add) a workflow and return the names whose caches were dropped"""
+        workflow = Worflow(workflow_str)
+        if workflow.name in self.workflows:
+            self._link(self.workflows[workflow.name], unlink=True)
+        self._link(workflow)
+        self.workflows[workflow.name] = workflow
+        stale = self.upstream(workflow.name)
+        for name in stale:
+            self.outcomes.pop(name, None)
+            self.volumes.pop(name, None)
+        return stale
+
+    def part1(self):
+        start = self.workflows["in"]
+        return sum(
+            part.value
+            for part in self.parts
+            if start.accepts(part, self.workflows, self.outcomes)
         )
-        return max(0, c_max - c_min + 1)
 
-    def count_all_possible(self):
-        return (
-            self.count_possible("s")
-            * self.count_possible("a")
-            * self.count_possible("m")
-            * self.count_possible("x")
+    def part2(self):
+        return self.workflows["in"].accepted_volume(
+            make_box(), self.workflows, self.volumes
         )
 
 
-if __name__ == "__main__":
-    workflows_str, parts_str = open(INPUT).read().split("\n\n")
-    parts = [Part(p) for p in parts_str.split("\n")]
+def parse(data: bytes):
+    workflows_str, parts_str = data.decode().strip().split("\n\n")
+    parts = PartArray.from_parts(Part(p) for p in parts_str.split("\n"))
 
     workflows_list = [Worflow(w) for w in workflows_str.split("\n")]
     workflows = {w.name: w for w in workflows_list}
+    return workflows, parts
+
 
-    part1 = sum([p.value for p in parts if p.apply(workflows) == "A"])
-    print(f"Part 1: {part1}")
+def accepted_value(part: Part, workflows: Dict):
+    return part.value if part.apply(workflows) == "A" else 0
 
-    part2 = sum(
-        [Criteria(w).count_all_possible() for w in workflows["in"].rules_that_win([])]
-    )
-    print(f"Part 2: {part2}")
+
+def part1(model):
+    workflows, parts = model
+    return map_reduce(partial(accepted_value, workflows=workflows), parts)
+
+
+def part2(model):
+    workflows, _ = model
+    return count_accepted(workflows)
+
+
+if __name__ == "__main__":
+    model = parse(open(INPUT, "rb").read())
+    print(f"Part 1: {part1(model)}")
+    print(f"Part 2: {part2(model)}")
@@ -0,0 +1,93 @@
+"""SQLite store of answers keyed by (day, part, input digest, solver version).
+
+The solver version is the parse cache's source digest of the day module
+and the repo modules it uses, so editing a solver never serves a stale
+answer. The store keeps at most max_entries answers and evicts the least
+recently used ones beyond that.
+"""
+import hashlib
+import json
+import sqlite3
+import time
+
+from parse_cache import parser_digest
+from runner import PARTS, ROOT, day_name, load_day, solve
+
+STORE_PATH = ROOT / ".cache" / "answers.sqlite"
+MAX_ENTRIES = 100_000
+
+KEY = "day = ? AND part = ? AND input_digest = ? AND solver = ?"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    day TEXT NOT NULL,
+    part INTEGER NOT NULL,
+    input_digest TEXT NOT NULL,
+    solver TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (day, part, input_digest, solver)
+)
+"""
+
+
+class AnswerStore:
+    def __init__(self, path=STORE_PATH, max_entries=MAX_ENTRIES):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.db = sqlite3.connect(path, timeout=30)
+        with self.db:
+            self.db.execute(SCHEMA)
+            self.db.execute(
+                "CREATE INDEX IF NOT EXISTS answers_last_used ON answers (last_used)"
+            )
+
+    def get(self, key):
+        """Stored answer for key, None when there is none"""
+        with self.db:
+            query = f"SELECT answer FROM answers WHERE {KEY}"
+            row = self.db.execute(query, key).fetchone()
+            if row is None:
+                return None
+            self.db.execute(
+                f"UPDATE answers SET last_used = ? WHERE {KEY}", (time.time(), *key)
+            )
+        return json.loads(row[0])
+
+    def put(self, key, answer):
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, json.dumps(answer), time.time()),
+            )
+            self.db.execute(
+                "DELETE FROM answers WHERE rowid IN ("
+                "SELECT rowid FROM answers ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def cached_solve(day, data: bytes, parts=PARTS, store=None, cache=False):
+    """Like runner.solve, but only solves the parts missing from the store"""
+    if store is None:
+        with AnswerStore() as store:
+            return cached_solve(day, data, parts, store, cache)
+    day = day_name(day)
+    input_digest = hashlib.sha256(data).hexdigest()
+    solver = parser_digest(load_day(day))
+    keys = {part: (day, part, input_digest, solver) for part in parts}
+    answers = {part: store.get(key) for part, key in keys.items()}
+    missing = tuple(part for part, answer in answers.items() if answer is None)
+    if missing:
+        for part, answer in solve(day, data, missing, cache).items():
+            store.put(keys[part], answer)
+            answers[part] = answer
+    return answers
@@ -0,0 +1,117 @@
+"""Solve many inputs in one warm process, writing one JSON line per input.
+
+Inputs come either as a day followed by files or directories (every file
+in a directory, sorted), or as a manifest of JSON lines such as
+{"day": "12", "input": "inputs/12/alice"}. Day modules are imported once
+and their caches emptied between inputs, so every input is solved as if
+by a fresh interpreter.
+"""
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from runner import PARTS, clear_caches, day_name, load_day, read_input, solve
+
+
+def solve_isolated(day, path, parts=PARTS):
+    """Result record for one input, with the error instead of answers on failure"""
+    day = day_name(day)
+    record = {"day": day, "input": str(path)}
+    start = time.perf_counter()
+    try:
+        clear_caches(load_day(day))
+        answers = solve(day, read_input(day, path), parts)
+        record.update({f"part{part}": answer for part, answer in answers.items()})
+    except Exception as e:
+        record["error"] = repr(e)
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def _solve_task(task):
+    day, path, parts = task
+    return solve_isolated(day, path, parts)
+
+
+def solve_batch(tasks, parts=PARTS, jobs=1):
+    """Yield a result record per (day, path) task, in task order
+
+    With jobs > 1 the tasks are spread over a pool of warm worker processes.
+    """
+    tasks = [(day, path, parts) for day, path in tasks]
+    if jobs == 1:
+        yield from map(_solve_task, tasks)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = jobs or os.cpu_count()
+    with ProcessPoolExecutor(jobs) as pool:
+        chunksize = max(1, len(tasks) // (4 * jobs))
+        yield from pool.map(_solve_task, tasks, chunksize=chunksize)
+
+
+def expand_paths(paths):
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(p for p in path.iterdir() if p.is_file())
+        else:
+            yield path
+
+
+def read_manifest(f):
+    for line in f:
+        if line.strip():
+            entry = json.loads(line)
+            yield entry["day"], entry["input"]
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("day", nargs="?", help="day of the inputs given as paths")
+    parser.add_argument("paths", nargs="*", help="input files or directories")
+    parser.add_argument("--manifest", type=Path, help="JSON lines manifest, - for stdin")
+    parser.add_argument(
+        "--part", type=int, choices=PARTS, action="append", help="parts to run"
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, help="worker processes (0: one per CPU)"
+    )
+    parser.add_argument(
+        "--shard",
+        help="only solve shard k of n, as k/n with k counting from 0",
+    )
+    parser.add_argument("--output", "-o", type=Path, help="JSON lines file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.manifest:
+        if args.day or args.paths:
+            parser.error("give either a manifest or a day and paths")
+        if str(args.manifest) == "-":
+            tasks = list(read_manifest(sys.stdin))
+        else:
+            with open(args.manifest) as f:
+                tasks = list(read_manifest(f))
+    elif args.day and args.paths:
+        tasks = [(args.day, path) for path in expand_paths(args.paths)]
+    else:
+        parser.error("give a day and input paths, or --manifest")
+    if args.shard:
+        k, n = map(int, args.shard.split("/"))
+        tasks = tasks[k::n]
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        for record in solve_batch(tasks, tuple(args.part or PARTS), args.jobs):
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+    finally:
+        if args.output:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Time parse, part 1 and part 2 of each day over a ladder of synthetic input sizes.
+
+For every phase the scaling exponent is the slope of log(time) against
+log(input bytes): about 1 is linear, 2 and above means the day goes quadratic.
+
+With --startup, measures instead how long a fresh interpreter takes to
+import each day module, and to start up and import it overall.
+"""
+import argparse
+import json
+import math
+import subprocess
+import sys
+import time
+
+from generators import GENERATORS, generate
+from runner import PARTS, ROOT, clear_caches, day_name, discover_days, load_day
+
+PHASES = ("parse",) + tuple(f"part{part}" for part in PARTS)
+SUPERLINEAR = 1.5
+
+
+def time_phases(day, data: bytes, repeat=1):
+    """Best of repeat wall times for each phase, with cold caches every time"""
+    module = load_day(day)
+    best = dict.fromkeys(PHASES, math.inf)
+    for _ in range(repeat):
+        clear_caches(module)
+        start = time.perf_counter()
+        model = module.parse(data)
+        best["parse"] = min(best["parse"], time.perf_counter() - start)
+        for part in PARTS:
+            start = time.perf_counter()
+            getattr(module, f"part{part}")(model)
+            best[f"part{part}"] = min(best[f"part{part}"], time.perf_counter() - start)
+    return best
+
+
+def warm_up(day, data: bytes):
+    """Run every phase once untimed so lazy imports don't land in the first timing"""
+    module = load_day(day)
+    model = module.parse(data)
+    for part in PARTS:
+        getattr(module, f"part{part}")(model)
+
+
+def exponent(xs, ys):
+    """Least squares slope of log(ys) against log(xs)"""
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(points) < 2:
+        return math.nan
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if var == 0:
+        return math.nan
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+
+
+def bench_day(day, sizes=None, seed=0, repeat=1):
+    sizes = sizes or GENERATORS[day][1]
+    warm_up(day, generate(day, min(sizes), seed))
+    rows = []
+    for size in sizes:
+        data = generate(day, size, seed)
+        rows.append({"size": size, "bytes": len(data), **time_phases(day, data, repeat)})
+    scaling = {
+        phase: exponent([r["bytes"] for r in rows], [r[phase] for r in rows])
+        for phase in PHASES
+    }
+    return {"day": day, "rows": rows, "scaling": scaling}
+
+
+def report(result):
+    lines = [f"day {result['day']}"]
+    lines.append(f"{'size':>10}{'bytes':>12}" + "".join(f"{p:>12}" for p in PHASES))
+    for row in result["rows"]:
+        lines.append(
+            f"{row['size']:>10}{row['bytes']:>12}"
+            + "".join(f"{row[p]:>12.5f}" for p in PHASES)
+        )
+    lines.append(
+        f"{'exponent':>22}"
+        + "".join(
+            f"{e:>11.2f}{'!' if e >= SUPERLINEAR else ' '}"
+            for e in result["scaling"].values()
+        )
+    )
+    return "\n".join(lines)
+
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import runner
+runner.load_day({day!r})
+print(time.perf_counter() - start)
+"""
+
+
+def bench_startup(day, repeat=5):
+    """Best of repeat fresh interpreters: module import time and whole process time"""
+    best = {"day": day, "import_s": math.inf, "process_s": math.inf}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET.format(day=day)],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        best["process_s"] = min(best["process_s"], time.perf_counter() - start)
+        best["import_s"] = min(best["import_s"], float(out.stdout))
+    return best
+
+
+def report_startup(results):
+    lines = [f"{'day':>4}{'import ms':>12}{'process ms':>12}"]
+    for r in results:
+        lines.append(f"{r['day']:>4}{r['import_s'] * 1e3:>12.2f}{r['process_s'] * 1e3:>12.2f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("days", nargs="*", help="days to benchmark (default: all)")
+    parser.add_argument("--sizes", type=int, nargs="+", help="override the size ladder")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="keep the best of n runs")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument(
+        "--startup", action="store_true", help="time interpreter startup and imports"
+    )
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        days = [day_name(d) for d in args.days] or discover_days()
+        results = [bench_startup(day, max(args.repeat, 5)) for day in days]
+        print(json.dumps(results, indent=2) if args.json else report_startup(results))
+        return
+
+    days = [day_name(d) for d in args.days] or sorted(GENERATORS)
+    results = []
+    for day in days:
+        result = bench_day(day, args.sizes, args.seed, args.repeat)
+        results.append(result)
+        if not args.json:
+            print(report(result), flush=True)
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
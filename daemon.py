@@ -0,0 +1,180 @@
+"""Warm solver daemon on a local Unix socket, and its client.
+
+    python daemon.py serve [--socket PATH] [--workers 4] [--queue 64]
+    python daemon.py ask 12 [--part 1] [--input PATH | --send < input]
+
+Every day module is imported at startup. A request is one JSON header line,
+{"day": "12", "parts": [1, 2], "path": "/abs/input"} or with "size": n
+followed by n bytes of input, and gets one JSON line back with part1/part2
+or error. Connections wait in a bounded queue for a pool of worker threads
+(a full queue is answered with a busy error), and parsed models and answers
+are kept in LRU caches keyed by the input digest, so repeated requests do
+not parse or solve again.
+"""
+import hashlib
+import json
+import os
+import queue
+import signal
+import socket
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from runner import PARTS, day_name, discover_days, load_day, read_input
+
+SOCKET_PATH = Path(tempfile.gettempdir()) / f"aoc2023-{os.getuid()}.sock"
+READ_TIMEOUT = 30
+
+
+class LRUCache:
+    """Thread-safe mapping dropping its least recently used entries"""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key not in self.entries:
+                return default
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+
+class Daemon:
+    def __init__(self, socket_path=SOCKET_PATH, workers=4, queue_size=64, cache_size=64):
+        self.socket_path = Path(socket_path)
+        self.workers = workers
+        self.pending = queue.Queue(queue_size)
+        self.models = LRUCache(cache_size)
+        self.answers = LRUCache(16 * cache_size)
+
+    def solve(self, day, parts, data: bytes):
+        digest = hashlib.sha256(data).digest()
+        module = load_day(day)
+        result = {}
+        for part in parts:
+            key = (day, part, digest)
+            answer = self.answers.get(key)
+            if answer is None:
+                model = self.models.get((day, digest))
+                if model is None:
+                    model = module.parse(data)
+                    self.models.put((day, digest), model)
+                answer = getattr(module, f"part{part}")(model)
+                self.answers.put(key, answer)
+            result[f"part{part}"] = answer
+        return result
+
+    def handle(self, conn):
+        conn.settimeout(READ_TIMEOUT)
+        with conn, conn.makefile("rb") as f:
+            try:
+                header = json.loads(f.readline())
+                day = day_name(header["day"])
+                parts = tuple(header.get("parts", PARTS))
+                if "size" in header:
+                    data = f.read(header["size"])
+                else:
+                    data = read_input(day, header["path"])
+                response = self.solve(day, parts, data)
+            except Exception as e:
+                response = {"error": repr(e)}
+            conn.sendall(json.dumps(response).encode() + b"\n")
+
+    def work(self):
+        while True:
+            conn = self.pending.get()
+            try:
+                self.handle(conn)
+            except OSError:
+                pass
+
+    def serve_forever(self):
+        for day in discover_days():
+            load_day(day)
+        for _ in range(self.workers):
+            threading.Thread(target=self.work, daemon=True).start()
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(str(self.socket_path))
+            server.listen(self.pending.maxsize)
+            try:
+                while True:
+                    conn, _ = server.accept()
+                    try:
+                        self.pending.put_nowait(conn)
+                    except queue.Full:
+                        with conn:
+                            conn.sendall(b'{"error": "busy"}\n')
+            finally:
+                self.socket_path.unlink(missing_ok=True)
+
+
+def ask(day, parts=PARTS, path=None, data=None, socket_path=SOCKET_PATH):
+    """Send one request to the daemon and return its decoded response"""
+    header = {"day": day_name(day), "parts": list(parts)}
+    if data is not None:
+        header["size"] = len(data)
+    else:
+        header["path"] = str(Path(path).resolve())
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(header).encode() + b"\n" + (data or b""))
+        with client.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--socket", type=Path, default=SOCKET_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="run the daemon")
+    serve.add_argument("--workers", type=int, default=4)
+    serve.add_argument("--queue", type=int, default=64, help="max waiting connections")
+    serve.add_argument("--cache", type=int, default=64, help="parsed models kept")
+    client = commands.add_parser("ask", help="send a request to the daemon")
+    client.add_argument("day")
+    client.add_argument("--part", type=int, choices=PARTS, action="append")
+    client.add_argument("--input", type=Path, help="input file read by the daemon")
+    client.add_argument("--send", action="store_true", help="send stdin as the input")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        # exit through the finally clauses, which remove the socket file
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        try:
+            Daemon(args.socket, args.workers, args.queue, args.cache).serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+    parts = tuple(args.part or PARTS)
+    if args.send:
+        response = ask(args.day, parts, data=sys.stdin.buffer.read(), socket_path=args.socket)
+    else:
+        path = args.input or Path("input")
+        response = ask(args.day, parts, path=path, socket_path=args.socket)
+    if "error" in response:
+        sys.exit(f"error: {response['error']}")
+    for part in parts:
+        print(f"day {day_name(args.day)} part {part}: {response[f'part{part}']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Map a pure per-record function over a process pool and reduce the results.
+
+Days whose records are independent (games, sequences, springs, patterns,
+parts) compute their answers with map_reduce. It times the first few
+records in-process to estimate the cost of one record, then either
+finishes in-process, when the whole input would take less than the pool
+overhead, or splits the remaining records into chunks of about
+TARGET_CHUNK_SECONDS each. Workers reduce their chunk before sending it
+back, and chunk results are reduced in record order, so op only needs to
+be associative.
+
+The pool is off by default: configure(jobs=n) or AOC_RECORD_JOBS=n turns
+it on, and configure(report=print) receives every chunking plan.
+"""
+import functools
+import math
+import operator
+import os
+import time
+from collections.abc import Sequence
+
+SAMPLE_RECORDS = 8
+MIN_PARALLEL_SECONDS = 0.2
+TARGET_CHUNK_SECONDS = 0.05
+
+_settings = {"jobs": int(os.environ.get("AOC_RECORD_JOBS", 1)), "report": None}
+
+
+def configure(jobs=None, report=None):
+    """Set the default worker count and a callback receiving each plan"""
+    if jobs is not None:
+        _settings["jobs"] = jobs or os.cpu_count()
+    _settings["report"] = report
+
+
+def _load_owner(module):
+    """Pool initializer: import the day module named module, if any
+
+    Takes the name rather than func itself so that spawned workers can
+    unpickle it before the day module exists in them.
+    """
+    if module.startswith("day"):
+        from runner import load_day
+
+        load_day(module[3:])
+
+
+def _reduce_chunk(func, op, chunk):
+    return functools.reduce(op, map(func, chunk))
+
+
+def map_reduce(func, records, op=operator.add, initial=0, jobs=None):
+    """op-reduction of func over records, starting from initial"""
+    if not isinstance(records, Sequence):
+        records = list(records)
+    jobs = jobs or _settings["jobs"]
+    start = time.perf_counter()
+    sample = [func(record) for record in records[:SAMPLE_RECORDS]]
+    cost = (time.perf_counter() - start) / max(1, len(sample))
+    rest = records[len(sample) :]
+    plan = {
+        "func": getattr(getattr(func, "func", func), "__qualname__", repr(func)),
+        "records": len(records),
+        "seconds_per_record": cost,
+        "workers": jobs,
+    }
+    result = functools.reduce(op, sample, initial)
+    if jobs <= 1 or not rest or cost * len(rest) < MIN_PARALLEL_SECONDS:
+        plan.update(mode="in-process", chunksize=len(rest), chunks=1 if rest else 0)
+        result = functools.reduce(op, map(func, rest), result)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        per_chunk = math.ceil(TARGET_CHUNK_SECONDS / max(cost, 1e-9))
+        chunksize = max(1, min(per_chunk, math.ceil(len(rest) / jobs)))
+        chunks = [rest[i : i + chunksize] for i in range(0, len(rest), chunksize)]
+        plan.update(mode="pool", chunksize=chunksize, chunks=len(chunks))
+        module = getattr(func, "func", func).__module__
+        with ProcessPoolExecutor(
+            jobs, initializer=_load_owner, initargs=(module,)
+        ) as pool:
+            n = len(chunks)
+            partials = pool.map(_reduce_chunk, [func] * n, [op] * n, chunks)
+            result = functools.reduce(op, partials, result)
+    plan["seconds"] = time.perf_counter() - start
+    if _settings["report"]:
+        _settings["report"](plan)
+    return result
@@ -0,0 +1,322 @@
+"""Seeded synthetic puzzle inputs for every day, scalable through a size knob.
+
+generate(day, size, seed) returns the input as bytes, in the same format as
+the real NN/input files.  What size counts depends on the day (lines, grid
+side, number of map entries...), see GENERATORS for the default ladders.
+"""
+import random
+import string
+
+CARDS = "AKQJT98765432"
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def gen_01(size, rng):
+    """Calibration lines mixing letters, digits and spelled-out digits"""
+    lines = []
+    for _ in range(size):
+        chunks = []
+        for _ in range(rng.randint(2, 8)):
+            r = rng.random()
+            if r < 0.3:
+                chunks.append(str(rng.randint(1, 9)))
+            elif r < 0.5:
+                chunks.append(rng.choice(DIGIT_WORDS))
+            else:
+                chunks.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 6))))
+        lines.append("".join(chunks))
+    return "\n".join(lines)
+
+
+def gen_02(size, rng):
+    """Cube games with up to six draws each"""
+    lines = []
+    for game_id in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colors))
+        lines.append(f"Game {game_id}: " + "; ".join(draws))
+    return "\n".join(lines)
+
+
+def gen_03(size, rng):
+    """Square engine schematic with numbers and symbols, size is the side"""
+    rows = []
+    for _ in range(size):
+        row = ""
+        while len(row) < size:
+            r = rng.random()
+            if r < 0.15:
+                row += str(rng.randint(1, 999))
+            elif r < 0.2:
+                row += rng.choice("*#+$/@%=&-")
+            else:
+                row += "."
+            row += "."
+        rows.append(row[:size])
+    return "\n".join(rows)
+
+
+def gen_04(size, rng):
+    """Scratchcards whose copies never run past the last card
+
+    Cards match less than once on average, otherwise the number of copies
+    grows exponentially with size.
+    """
+    lines = []
+    for card in range(1, size + 1):
+        numbers = rng.sample(range(1, 100), 35)
+        winning, others = numbers[:10], numbers[10:]
+        matches = rng.randint(1, 7) if rng.random() < 0.2 else 0
+        matches = min(matches, size - card)
+        draw = winning[:matches] + others[: 25 - matches]
+        rng.shuffle(draw)
+        winning_str = " ".join(f"{x:2d}" for x in winning)
+        draw_str = " ".join(f"{x:2d}" for x in draw)
+        lines.append(f"Card {card:4d}: {winning_str} | {draw_str}")
+    return "\n".join(lines)
+
+
+def gen_05(size, rng):
+    """Almanac with size seed ranges and size entries in each of the 7 maps"""
+    top = 2**32
+    starts = sorted(rng.sample(range(top), 2 * size))
+    seeds = []
+    for start, end in zip(starts[::2], starts[1::2]):
+        seeds += [start, rng.randint(1, end - start)]
+    blocks = [f"seeds: {' '.join(map(str, seeds))}"]
+    names = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+    for src_name, dst_name in zip(names[:-1], names[1:]):
+        cuts = sorted(rng.sample(range(top), 2 * size))
+        entries = []
+        for start, end in zip(cuts[::2], cuts[1::2]):
+            length = end - start
+            entries.append(f"{rng.randint(0, top - length)} {start} {length}")
+        rng.shuffle(entries)
+        blocks.append(f"{src_name}-to-{dst_name} map:\n" + "\n".join(entries))
+    return "\n\n".join(blocks)
+
+
+def gen_06(size, rng):
+    """Four races, size is the longest race time
+
+    Distances have fewer digits than the squared times, so that the
+    concatenated part 2 race can still be won.
+    """
+    times = [rng.randint(max(7, size // 2), max(7, size)) for _ in range(4)]
+    distances = [
+        rng.randint(1, min(t * t // 4 - 1, 10 ** (2 * len(str(t)) - 1) - 1)) for t in times
+    ]
+    return "Time: " + " ".join(map(str, times)) + "\nDistance: " + " ".join(map(str, distances))
+
+
+def gen_07(size, rng):
+    """Camel cards hands with bids"""
+    return "\n".join(
+        f"{''.join(rng.choices(CARDS, k=5))} {rng.randint(1, 1000)}" for _ in range(size)
+    )
+
+
+def node_names(rng, count, last_chars, exclude=()):
+    """count distinct 3 character node names ending with one of last_chars"""
+    alphabet = string.ascii_uppercase + string.digits
+    names = set()
+    while len(names) < count:
+        name = "".join(rng.choices(alphabet, k=2)) + rng.choice(last_chars)
+        if name not in exclude:
+            names.add(name)
+    return list(names)
+
+
+def gen_08(size, rng):
+    """Ghost network with about size nodes, each ghost cycling through one Z node
+
+    Like the real inputs, every ghost loop is a multiple of the instruction
+    length. Node names are 3 characters, which caps size at about 40000.
+    """
+    primes = [2, 3, 5, 7, 11, 13]
+    length = max(1, size // (len(primes) + sum(primes)))
+    interior_chars = [c for c in string.ascii_uppercase + string.digits if c not in "AZ"]
+    interior = node_names(rng, sum(p * length - 1 for p in primes), interior_chars)
+    starts = ["AAA"] + node_names(rng, len(primes) - 1, "A", exclude={"AAA"})
+    ends = ["ZZZ"] + node_names(rng, len(primes) - 1, "Z", exclude={"ZZZ"})
+    lines = []
+    for start, end, p in zip(starts, ends, primes):
+        chain = [interior.pop() for _ in range(p * length - 1)] + [end]
+        lines.append(f"{start} = ({chain[0]}, {chain[0]})")
+        for node, nxt in zip(chain, chain[1:] + chain[:1]):
+            lines.append(f"{node} = ({nxt}, {nxt})")
+    rng.shuffle(lines)
+    instructions = "".join(rng.choices("LR", k=length))
+    return instructions + "\n\n" + "\n".join(lines)
+
+
+def gen_09(size, rng):
+    """Sequences of 21 values of random polynomials"""
+    lines = []
+    for _ in range(size):
+        coefs = [rng.randint(-9, 9) for _ in range(rng.randint(1, 6))]
+        values = [sum(c * x**k for k, c in enumerate(coefs)) for x in range(21)]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines)
+
+
+PIPES = {
+    frozenset("NS"): "|",
+    frozenset("EW"): "-",
+    frozenset("NE"): "L",
+    frozenset("NW"): "J",
+    frozenset("SW"): "7",
+    frozenset("SE"): "F",
+}
+
+
+def gen_10(size, rng):
+    """Square pipe maze, size is the side
+
+    The loop runs along the top row and hangs down to a random depth in every
+    column. S sits on the vertical run of the first column, as the solver
+    expects it to be a | connected to the tile below.
+    """
+    size = max(size, 6)
+    n_cols = size - 2
+    bottoms = [rng.randint(3, size - 2) for _ in range(n_cols + 1)]
+    path = [(1, j) for j in range(1, n_cols + 1)]
+    path += [(i, n_cols) for i in range(2, bottoms[n_cols] + 1)]
+    for j in range(n_cols, 1, -1):
+        i = bottoms[j]
+        path.append((i, j - 1))
+        step = 1 if bottoms[j - 1] > i else -1
+        if j - 1 > 1:
+            path += [(k, j - 1) for k in range(i + step, bottoms[j - 1] + step, step)]
+    path += [(i, 1) for i in range(path[-1][0] - 1, 1, -1)]
+
+    grid = [rng.choices(".|-LJ7F", k=size) for _ in range(size)]
+    for k, (i, j) in enumerate(path):
+        directions = set()
+        for ni, nj in (path[k - 1], path[(k + 1) % len(path)]):
+            directions.add("N" if ni < i else "S" if ni > i else "W" if nj < j else "E")
+        grid[i][j] = PIPES[frozenset(directions)]
+    i_start = rng.randint(2, bottoms[2] - 1)
+    grid[i_start][1] = "S"
+    return "\n".join("".join(row) for row in grid)
+
+
+def gen_11(size, rng):
+    """Square sky map, size is the side"""
+    empty_rows = set(rng.sample(range(size), size // 10))
+    empty_cols = set(rng.sample(range(size), size // 10))
+    rows = []
+    for i in range(size):
+        rows.append(
+            "".join(
+                "#" if i not in empty_rows and j not in empty_cols and rng.random() < 0.05 else "."
+                for j in range(size)
+            )
+        )
+    return "\n".join(rows)
+
+
+def gen_12(size, rng):
+    """Spring records with at least one consistent arrangement"""
+    lines = []
+    for _ in range(size):
+        springs = [rng.choice("#.") for _ in range(rng.randint(6, 20))]
+        springs[rng.randrange(len(springs))] = "#"
+        groups = [len(g) for g in "".join(springs).split(".") if g]
+        record = "".join("?" if rng.random() < 0.5 else c for c in springs)
+        lines.append(f"{record} {','.join(map(str, groups))}")
+    return "\n".join(lines)
+
+
+def gen_13(size, rng):
+    """Mirror patterns with one smudge, size is the number of patterns"""
+    patterns = []
+    for _ in range(size):
+        n_rows, n_cols = rng.randint(5, 17), rng.randint(5, 17)
+        rows = [[rng.choice("#.") for _ in range(n_cols)] for _ in range(n_rows)]
+        if rng.random() < 0.5:
+            axis = rng.randint(1, n_rows - 1)
+            for i in range(axis, min(n_rows, 2 * axis)):
+                rows[i] = list(rows[2 * axis - 1 - i])
+        else:
+            axis = rng.randint(1, n_cols - 1)
+            for row in rows:
+                for j in range(axis, min(n_cols, 2 * axis)):
+                    row[j] = row[2 * axis - 1 - j]
+        i, j = rng.randrange(n_rows), rng.randrange(n_cols)
+        rows[i][j] = "#" if rows[i][j] == "." else "."
+        patterns.append("\n".join("".join(row) for row in rows))
+    return "\n\n".join(patterns)
+
+
+def gen_14(size, rng):
+    """Square platform of round and cube rocks, size is the side"""
+    return "\n".join(
+        "".join(rng.choices("O#.", weights=(2, 1, 5), k=size)) for _ in range(size)
+    )
+
+
+def gen_15(size, rng):
+    """Lens steps drawn from a pool of about size / 4 labels"""
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(max(1, size // 4))
+    ]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        steps.append(f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}")
+    return ",".join(steps)
+
+
+def gen_19(size, rng):
+    """size workflows forming a DAG from in, followed by size parts"""
+    names = set()
+    while len(names) < size - 1:
+        name = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 4)))
+        if name != "in":
+            names.add(name)
+    names = ["in"] + sorted(names, key=lambda _: rng.random())
+    workflows = []
+    for i, name in enumerate(names):
+        targets = ["A", "R"] + names[i + 1 : i + 20]
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{rng.choice(targets)}"
+            for _ in range(rng.randint(1, 4))
+        ]
+        rules.append(rng.choice(targets))
+        workflows.append(f"{name}{{{','.join(rules)}}}")
+    rng.shuffle(workflows)
+    parts = [
+        "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in "xmas") + "}"
+        for _ in range(size)
+    ]
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts)
+
+
+# generator and default size ladder for each day
+GENERATORS = {
+    "01": (gen_01, (1000, 4000, 16000)),
+    "02": (gen_02, (1000, 4000, 16000)),
+    "03": (gen_03, (50, 100, 200)),
+    "04": (gen_04, (1000, 4000, 16000)),
+    "05": (gen_05, (50, 200, 800)),
+    "06": (gen_06, (1000, 10000, 100000)),
+    "07": (gen_07, (1000, 4000, 16000)),
+    "08": (gen_08, (1000, 4000, 16000)),
+    "09": (gen_09, (1000, 4000, 16000)),
+    "10": (gen_10, (50, 100, 200)),
+    "11": (gen_11, (20, 30, 40)),
+    "12": (gen_12, (250, 1000, 4000)),
+    "13": (gen_13, (100, 400, 1600)),
+    "14": (gen_14, (10, 20, 40)),
+    "15": (gen_15, (1000, 4000, 16000)),
+    "19": (gen_19, (100, 400, 1600)),
+}
+
+
+def generate(day, size, seed=0) -> bytes:
+    gen, _ = GENERATORS[f"{int(day):02d}"]
+    return gen(size, random.Random(f"{day}-{size}-{seed}")).encode()
@@ -0,0 +1,97 @@
+"""Character grids stored as one contiguous uint8 buffer.
+
+The buffer is the puzzle input itself, rows separated by newlines, so a
+Grid can wrap bytes or a memory-mapped file without copying. Cell (i, j)
+lives at flat index i * stride + j, where stride is the row length plus
+the newline.
+"""
+import mmap
+from functools import cached_property
+
+NEIGHBOURS_8 = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+class Grid:
+    def __init__(self, buffer, n_rows: int, n_cols: int, stride: int):
+        # bytes, bytearray or mmap: anything with find and extended slicing
+        self.buffer = buffer
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.stride = stride
+        self.end = max(0, n_rows * stride - 1)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Wrap newline separated rows of equal length, without copying"""
+        end = len(data)
+        while end and data[end - 1] in b"\r\n":
+            end -= 1
+        n_cols = data.find(b"\n", 0, end)
+        if n_cols < 0:
+            n_cols = end
+        stride = n_cols + 1
+        if (end + 1) % stride:
+            raise ValueError(f"rows are not all {n_cols} characters long")
+        return cls(data, (end + 1) // stride, n_cols, stride)
+
+    @classmethod
+    def from_file(cls, path):
+        """Memory-map a file read-only and wrap it"""
+        with open(path, "rb") as f:
+            return cls.from_bytes(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @property
+    def shape(self):
+        return self.n_rows, self.n_cols
+
+    def coords(self, k: int):
+        return divmod(k, self.stride)
+
+    def __getitem__(self, pos) -> int:
+        i, j = pos
+        return self.buffer[i * self.stride + j]
+
+    def row(self, i: int) -> bytes:
+        start = i * self.stride
+        return self.buffer[start : start + self.n_cols]
+
+    def column(self, j: int) -> bytes:
+        return self.buffer[j : self.end : self.stride]
+
+    def find(self, char: str):
+        """Coordinates of the first cell holding char, None if there is none"""
+        k = self.buffer.find(char.encode(), 0, self.end)
+        return None if k < 0 else self.coords(k)
+
+    @cached_property
+    def transposed(self) -> "Grid":
+        """Rows become columns, and transposing back returns this grid"""
+        result = Grid.from_bytes(b"\n".join(self.column(j) for j in range(self.n_cols)))
+        result.__dict__["transposed"] = self
+        return result
+
+    def padded(self, char: str = ".", width: int = 1) -> "Grid":
+        """Copy surrounded by width rows and columns of char"""
+        pad = char.encode() * width
+        border = [char.encode() * (self.n_cols + 2 * width)] * width
+        rows = [pad + self.row(i) + pad for i in range(self.n_rows)]
+        return Grid.from_bytes(b"\n".join(border + rows + border))
+
+    def offsets(self, neighbours=NEIGHBOURS_8):
+        """Flat index offsets of the neighbours of a cell"""
+        return tuple(di * self.stride + dj for di, dj in neighbours)
+
+    def array(self):
+        """(n_rows, n_cols) uint8 NumPy view of the buffer, without copying"""
+        import numpy as np
+
+        return np.ndarray(
+            self.shape, dtype=np.uint8, buffer=self.buffer, strides=(self.stride, 1)
+        )
+
+    def mask(self, char: str):
+        """(n_rows, n_cols) uint8 NumPy array, 1 where the cell holds char"""
+        return (self.array() == ord(char)).view("uint8")
+
+    def __repr__(self):
+        return f"Grid {self.n_rows}x{self.n_cols}"
@@ -0,0 +1,85 @@
+"""Per-phase timing, memory and call count instrumentation for the day modules.
+
+A day module opts into call counting by listing its hot helpers in a
+module level INSTRUMENTED tuple, e.g. ("count_possible_solutions",) or
+("Platform.cycle",) for a method. Parse, part 1 and part 2 are always
+measured for wall time, CPU time, peak traced memory and the net number
+of allocated blocks.
+"""
+import functools
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+from runner import PARTS, load_day
+
+
+def _counted(counts, name, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        counts[name] += 1
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def count_calls(module):
+    """Count calls to the module's INSTRUMENTED helpers while the block runs"""
+    counts = Counter()
+    patched = []
+    for name in getattr(module, "INSTRUMENTED", ()):
+        owner_name, _, attr = name.rpartition(".")
+        owner = getattr(module, owner_name) if owner_name else module
+        original = vars(owner)[attr]
+        setattr(owner, attr, _counted(counts, name, original))
+        patched.append((owner, attr, original))
+    try:
+        yield counts
+    finally:
+        for owner, attr, original in reversed(patched):
+            setattr(owner, attr, original)
+
+
+def measure(func, *args):
+    """Run func(*args) and return its result with resource usage of the call
+
+    Expects tracemalloc to be tracing already.
+    """
+    tracemalloc.reset_peak()
+    memory_before = tracemalloc.get_traced_memory()[0]
+    blocks_before = sys.getallocatedblocks()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    result = func(*args)
+    stats = {
+        "wall_s": time.perf_counter() - wall_start,
+        "cpu_s": time.process_time() - cpu_start,
+        "peak_bytes": tracemalloc.get_traced_memory()[1] - memory_before,
+        "net_blocks": sys.getallocatedblocks() - blocks_before,
+    }
+    return result, stats
+
+
+def instrumented_solve(day, data: bytes, parts=PARTS):
+    """Like runner.solve, but returns a JSON-ready report along with the answers"""
+    module = load_day(day)
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        with count_calls(module) as counts:
+            model, parse_stats = measure(module.parse, data)
+            report = {"day": day, "input_bytes": len(data), "phases": {"parse": parse_stats}}
+            answers = {}
+            for part in parts:
+                answers[part], report["phases"][f"part{part}"] = measure(
+                    getattr(module, f"part{part}"), model
+                )
+    finally:
+        if started:
+            tracemalloc.stop()
+    report["calls"] = dict(counts)
+    report["answers"] = {f"part{part}": answer for part, answer in answers.items()}
+    return answers, report
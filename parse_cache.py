@@ -0,0 +1,95 @@
+"""Content-addressed on-disk cache of parsed models.
+
+Entries are keyed by the SHA-256 of the input bytes and of the parser
+sources: the day module plus any module of this repo it pulls objects
+from (grid.py...). Editing either the input or the parser therefore
+misses the cache without any manual invalidation.
+
+Grids and NumPy arrays are stored raw and memory-mapped back read-only,
+every other model is pickled.
+"""
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from grid import Grid
+from runner import ROOT, day_name, load_day
+
+CACHE_DIR = ROOT / ".cache" / "parsed"
+
+_parser_digests = {}
+
+
+def parser_digest(module) -> str:
+    """Hash of the source files of the module and of the repo modules it uses"""
+    if module.__name__ not in _parser_digests:
+        files = {Path(module.__file__)}
+        for obj in vars(module).values():
+            if inspect.ismodule(obj) or inspect.isclass(obj) or inspect.isfunction(obj):
+                try:
+                    path = Path(inspect.getfile(obj)).resolve()
+                except TypeError:
+                    continue
+                if ROOT in path.parents:
+                    files.add(path)
+        digest = hashlib.sha256()
+        for path in sorted(files):
+            digest.update(path.read_bytes())
+        _parser_digests[module.__name__] = digest.hexdigest()
+    return _parser_digests[module.__name__]
+
+
+def cache_key(day, data: bytes) -> str:
+    input_digest = hashlib.sha256(data).hexdigest()
+    return f"{input_digest[:32]}-{parser_digest(load_day(day))[:16]}"
+
+
+def _is_array(model):
+    return type(model).__name__ == "ndarray" and type(model).__module__ == "numpy"
+
+
+def _dump(model, stem: Path) -> Path:
+    if isinstance(model, Grid):
+        path = stem.with_suffix(".grid")
+        write = lambda f: f.write(model.buffer[: model.end])
+    elif _is_array(model):
+        import numpy as np
+
+        path = stem.with_suffix(".npy")
+        write = lambda f: np.save(f, model)
+    else:
+        path = stem.with_suffix(".pkl")
+        write = lambda f: pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+    # write then rename, so that concurrent runs never see a partial entry
+    with tempfile.NamedTemporaryFile(dir=stem.parent, delete=False) as f:
+        write(f)
+    os.replace(f.name, path)
+    return path
+
+
+def _load(path: Path):
+    if path.suffix == ".grid":
+        return Grid.from_file(path)
+    if path.suffix == ".npy":
+        import numpy as np
+
+        return np.load(path, mmap_mode="r")
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def cached_parse(day, data: bytes, cache_dir=CACHE_DIR):
+    """Parsed model for data, from the cache when this input was parsed before"""
+    day = day_name(day)
+    stem = Path(cache_dir) / day / cache_key(day, data)
+    for suffix in (".grid", ".npy", ".pkl"):
+        path = stem.with_suffix(suffix)
+        if path.exists():
+            return _load(path)
+    model = load_day(day).parse(data)
+    stem.parent.mkdir(parents=True, exist_ok=True)
+    _dump(model, stem)
+    return model
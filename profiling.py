@@ -0,0 +1,142 @@
+"""Profile a day's parse and part, as collapsed stacks and a hot function table.
+
+Two profilers fill the same Counter of {stack: seconds}, where a stack is a
+tuple of frame labels from parse or partN down to the running function:
+
+- "sample" interrupts the process every interval of CPU time (SIGPROF) and
+  charges the CPU time since the previous sample to the current Python
+  stack, as signals arrive less often than asked for. Cheap, but C calls show
+  up as the Python frame that made them.
+- "deterministic" follows every Python and C call with sys.setprofile and
+  charges the exact time between events. Slow, but misses nothing.
+
+write_collapsed writes one "frame;frame;frame microseconds" line per stack,
+the input format of flamegraph.pl, speedscope and inferno. Nothing here is
+imported unless runner.py is given --profile.
+"""
+import signal
+import sys
+import time
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+from runner import ROOT, load_day
+
+INTERVAL = 0.001
+
+
+@lru_cache(maxsize=None)
+def _label(code):
+    path = Path(code.co_filename)
+    if path.is_relative_to(ROOT):
+        path = path.relative_to(ROOT)
+    name = getattr(code, "co_qualname", code.co_name)  # Python 3.11+
+    return f"{name} ({path}:{code.co_firstlineno})"
+
+
+def _builtin_label(func):
+    name = getattr(func, "__qualname__", repr(func))
+    module = getattr(func, "__module__", None)
+    return f"{module}.{name} (built-in)" if module else f"{name} (built-in)"
+
+
+def sample(stacks, func, *args, interval=INTERVAL):
+    """func(*args), adding the sampled stacks below it to stacks"""
+    root = None
+    last = time.process_time()
+
+    def on_sample(signum, frame):
+        nonlocal last
+        labels = []
+        while frame is not None and frame is not root:
+            if frame.f_code.co_filename == __file__:
+                # the previous sample is still being recorded
+                return
+            labels.append(_label(frame.f_code))
+            frame = frame.f_back
+        now = time.process_time()
+        if frame is root and labels:
+            stacks[tuple(reversed(labels))] += now - last
+        last = now
+
+    def run():
+        nonlocal root
+        root = sys._getframe()
+        return func(*args)
+
+    previous = signal.signal(signal.SIGPROF, on_sample)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        return run()
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous)
+
+
+def trace(stacks, func, *args):
+    """func(*args), adding the exact time of every stack below it to stacks"""
+    stack = ()
+    last = time.perf_counter()
+
+    def on_event(frame, event, arg):
+        nonlocal stack, last
+        now = time.perf_counter()
+        if stack:
+            stacks[stack] += now - last
+        if event == "call":
+            stack += (_label(frame.f_code),)
+        elif event == "c_call":
+            stack += (_builtin_label(arg),)
+        elif stack:
+            stack = stack[:-1]
+        last = time.perf_counter()
+
+    def run():
+        sys.setprofile(on_event)
+        try:
+            return func(*args)
+        finally:
+            sys.setprofile(None)
+
+    return run()
+
+
+def profiled_solve(day, data: bytes, part, mode="sample", interval=INTERVAL):
+    """Answer of one day part, with the stacks of its parse and part"""
+    module = load_day(day)
+    solve_part = getattr(module, f"part{part}")
+    stacks = Counter()
+    if mode == "sample":
+        model = sample(stacks, module.parse, data, interval=interval)
+        answer = sample(stacks, solve_part, model, interval=interval)
+    else:
+        model = trace(stacks, module.parse, data)
+        answer = trace(stacks, solve_part, model)
+    return answer, stacks
+
+
+def write_collapsed(stacks, path):
+    with open(path, "w") as f:
+        for stack, seconds in sorted(stacks.items()):
+            microseconds = round(seconds * 1e6)
+            if microseconds:
+                f.write(f"{';'.join(stack)} {microseconds}\n")
+
+
+def hot_functions(stacks, top=20):
+    """(label, self seconds, total seconds) of the top functions by self time"""
+    own, total = Counter(), Counter()
+    for stack, seconds in stacks.items():
+        own[stack[-1]] += seconds
+        for label in set(stack):
+            total[label] += seconds
+    return [(label, seconds, total[label]) for label, seconds in own.most_common(top)]
+
+
+def report(stacks, top=20, file=sys.stderr):
+    overall = sum(stacks.values())
+    print(f"{'self s':>9} {'self %':>7} {'total s':>9}  function", file=file)
+    for label, own, total in hot_functions(stacks, top):
+        share = 100 * own / overall if overall else 0
+        print(f"{own:9.4f} {share:6.1f}% {total:9.4f}  {label}", file=file)
@@ -0,0 +1,287 @@
+"""Run any selection of days from a single process.
+
+Every day lives in NN/NN.py and exposes the same interface:
+parse(data: bytes) -> model, part1(model) and part2(model).
+"""
+import importlib.util
+import os
+import signal
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+INPUT = "input"
+PARTS = (1, 2)
+
+_modules = {}
+
+
+def day_name(day) -> str:
+    return f"{int(day):02d}"
+
+
+def discover_days():
+    """All NN directories holding an NN.py module"""
+    return sorted(
+        p.name
+        for p in ROOT.iterdir()
+        if p.is_dir() and p.name.isdigit() and (p / f"{p.name}.py").is_file()
+    )
+
+
+def load_day(day):
+    """Import NN/NN.py once and keep it around as module dayNN"""
+    day = day_name(day)
+    if day not in _modules:
+        if str(ROOT) not in sys.path:
+            # days import repo modules such as grid and executor
+            sys.path.insert(0, str(ROOT))
+        name = f"day{day}"
+        spec = importlib.util.spec_from_file_location(name, ROOT / day / f"{day}.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        _modules[day] = module
+    return _modules[day]
+
+
+def input_path(day, input_dir=ROOT) -> Path:
+    return Path(input_dir) / day_name(day) / INPUT
+
+
+def read_input(day, path=None, input_dir=ROOT) -> bytes:
+    with open(path or input_path(day, input_dir), "rb") as f:
+        return f.read()
+
+
+def clear_caches(module):
+    """Empty the functools caches of a day module, e.g. between unrelated inputs"""
+    for obj in vars(module).values():
+        if callable(getattr(obj, "cache_clear", None)):
+            obj.cache_clear()
+
+
+def solve(day, data: bytes, parts=PARTS, cache=False):
+    """Parse data once and run the requested parts on the same model
+
+    With cache, the model comes from the on-disk parse cache when possible.
+    """
+    module = load_day(day)
+    if cache:
+        from parse_cache import cached_parse
+
+        model = cached_parse(day, data)
+    else:
+        model = module.parse(data)
+    return {part: getattr(module, f"part{part}")(model) for part in parts}
+
+
+class TaskTimeout(Exception):
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise TaskTimeout()
+
+
+def _solve_part(day, data: bytes, part, timeout=None, cache=False, answer_cache=False):
+    """Pool task: solve a single part, interrupted after timeout seconds"""
+    if timeout:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        if answer_cache:
+            from answers import cached_solve
+
+            return cached_solve(day, data, (part,), cache=cache)[part]
+        return solve(day, data, (part,), cache)[part]
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def solve_parallel(
+    inputs, parts=PARTS, jobs=None, timeout=None, cache=False, answer_cache=False
+):
+    """Solve every (day, part) in a process pool
+
+    inputs maps each day to its input bytes, or to the exception raised
+    reading them. Yields (day, part, answer) in day then part order whatever
+    the completion order, with a TaskTimeout or other exception as answer
+    when a task fails or its input could not be read.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    tasks = [(day, part) for day in inputs for part in parts]
+    with ProcessPoolExecutor(jobs or os.cpu_count()) as pool:
+        futures = [
+            inputs[day]
+            if isinstance(inputs[day], Exception)
+            else pool.submit(
+                _solve_part, day, inputs[day], part, timeout, cache, answer_cache
+            )
+            for day, part in tasks
+        ]
+        for (day, part), future in zip(tasks, futures):
+            if isinstance(future, Exception):
+                yield day, part, future
+                continue
+            try:
+                yield day, part, future.result()
+            except Exception as e:
+                yield day, part, e
+
+
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("days", nargs="*", help="days to run (default: all)")
+    parser.add_argument(
+        "--part", type=int, choices=PARTS, action="append", help="parts to run"
+    )
+    parser.add_argument("--input", type=Path, help="input file (single day only)")
+    parser.add_argument(
+        "--input-dir", type=Path, default=ROOT, help="directory holding NN/input files"
+    )
+    parser.add_argument(
+        "--instrument",
+        action="store_true",
+        help="print a JSON line per day with timings, memory and call counts",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=("sample", "deterministic"),
+        help="profile each day part into NN-partN.collapsed files in --profile-dir",
+    )
+    parser.add_argument(
+        "--profile-dir", type=Path, default=Path("."), help="where to write profiles"
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=20,
+        help="hot functions listed on stderr per profile",
+    )
+    parser.add_argument(
+        "--profile-interval", type=float, default=0.001, help="seconds between samples"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="solve days and parts in a pool of n processes (0: one per CPU)",
+    )
+    parser.add_argument(
+        "--timeout", type=float, help="seconds allowed per day part when using --jobs"
+    )
+    parser.add_argument(
+        "--cache", action="store_true", help="reuse parsed models cached on disk"
+    )
+    parser.add_argument(
+        "--no-answer-cache",
+        dest="answer_cache",
+        action="store_false",
+        help="always solve, ignoring the stored answers (for benchmarking)",
+    )
+    parser.add_argument(
+        "--record-jobs",
+        type=int,
+        help="map independent records over n processes, plans go to stderr",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="fold the input line by line (--input - reads stdin)",
+    )
+    args = parser.parse_args(argv)
+    args.days = [day_name(d) for d in args.days] or discover_days()
+    args.part = tuple(args.part or PARTS)
+    if args.input and len(args.days) != 1:
+        parser.error("--input needs exactly one day")
+    if args.timeout and args.jobs == 1:
+        parser.error("--timeout only applies to pool tasks, add --jobs")
+    if args.instrument and args.jobs != 1:
+        parser.error("--instrument runs in a single process, drop --jobs")
+    if args.profile and (args.jobs != 1 or args.instrument or args.stream):
+        parser.error("--profile cannot be used with --jobs, --instrument or --stream")
+    if args.stream:
+        if len(args.days) != 1:
+            parser.error("--stream needs exactly one day")
+        if not hasattr(load_day(args.days[0]), "stream"):
+            parser.error(f"day {args.days[0]} has no streaming mode")
+    return args
+
+
+def main(argv=None):
+    import json
+
+    args = parse_args(argv)
+    if args.record_jobs is not None:
+        import executor
+
+        executor.configure(
+            jobs=args.record_jobs,
+            report=lambda plan: print(json.dumps(plan), file=sys.stderr),
+        )
+    if args.stream:
+        from streaming import iter_lines, open_stream
+
+        day = args.days[0]
+        path = args.input or input_path(day, args.input_dir)
+        with open_stream(path) as f:
+            answers = load_day(day).stream(iter_lines(f))
+        for part, answer in zip(PARTS, answers):
+            print(f"day {day} part {part}: {answer}")
+        return
+    if args.jobs != 1:
+        inputs = {}
+        for day in args.days:
+            try:
+                inputs[day] = read_input(day, args.input, args.input_dir)
+            except OSError as e:
+                inputs[day] = e
+        for day, part, answer in solve_parallel(
+            inputs, args.part, args.jobs, args.timeout, args.cache, args.answer_cache
+        ):
+            if isinstance(answer, TaskTimeout):
+                answer = f"timed out after {args.timeout}s"
+            elif isinstance(answer, Exception):
+                answer = f"failed with {answer!r}"
+            print(f"day {day} part {part}: {answer}")
+        return
+    for day in args.days:
+        data = read_input(day, args.input, args.input_dir)
+        if args.instrument:
+            from instrument import instrumented_solve
+
+            _, report = instrumented_solve(day, data, args.part)
+            print(json.dumps(report), flush=True)
+            continue
+        if args.profile:
+            import profiling
+
+            args.profile_dir.mkdir(parents=True, exist_ok=True)
+            for part in args.part:
+                answer, stacks = profiling.profiled_solve(
+                    day, data, part, args.profile, args.profile_interval
+                )
+                path = args.profile_dir / f"{day}-part{part}.collapsed"
+                profiling.write_collapsed(stacks, path)
+                print(f"day {day} part {part}: {answer}", flush=True)
+                print(f"day {day} part {part} profile: {path}", file=sys.stderr)
+                profiling.report(stacks, args.profile_top)
+            continue
+        if args.answer_cache:
+            from answers import cached_solve
+
+            answers = cached_solve(day, data, args.part, cache=args.cache)
+        else:
+            answers = solve(day, data, args.part, args.cache)
+        for part, answer in answers.items():
+            print(f"day {day} part {part}: {answer}")
+
+
+if __name__ == "__main__":
+    main()
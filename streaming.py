@@ -0,0 +1,32 @@
+"""Read line-oriented inputs in large blocks, one record at a time.
+
+Days that can fold their answers line by line expose stream(lines) ->
+(part1, part2), which consumes any iterable of lines. Memory then stays
+flat whatever the input size, e.g. when piping generated data through
+runner.py --stream --input -.
+"""
+import sys
+
+BLOCK_SIZE = 1 << 20
+
+
+def iter_lines(f, block_size=BLOCK_SIZE):
+    """Decoded lines of a binary file object, without their newline"""
+    rest = b""
+    while True:
+        block = f.read(block_size)
+        if not block:
+            break
+        lines = (rest + block).split(b"\n")
+        rest = lines.pop()
+        for line in lines:
+            yield line.decode()
+    if rest:
+        yield rest.decode()
+
+
+def open_stream(path=None):
+    """Unbuffered binary file for path, stdin for None or '-'"""
+    if path is None or str(path) == "-":
+        return sys.stdin.buffer
+    return open(path, "rb", buffering=0)
@@ -1,6 +1,97 @@
-def sum2(a,b):
-    1
-    1
-    1
-    1
-    return a+b
\ No newline at end of file
+from itertools import product
+
+from generators import generate
+from runner import load_day
+
+DAY19_EXAMPLE = b"""\
+px{a<2006:qkq,m>2090:A,rfg}
+pv{a>1716:R,A}
+lnx{m>1548:A,A}
+rfg{s<537:gd,x>2440:R,A}
+qs{s>3448:A,lnx}
+qkq{x<1416:A,crn}
+crn{x>2662:A,R}
+in{s<1351:px,qqz}
+qqz{s>2770:qs,m<1801:hdj,R}
+gd{a>3333:R,R}
+hdj{m>838:A,pv}
+
+{x=787,m=2655,a=1222,s=2876}
+{x=1679,m=44,a=2067,s=496}
+{x=2036,m=264,a=79,s=2244}
+{x=2461,m=1339,a=466,s=291}
+{x=2127,m=1623,a=2188,s=1013}
+"""
+
+DAY19_SMALL = b"""\
+in{x<5:lo,m>7:hi,s<3:A,R}
+lo{a>9:R,s>6:A,hi}
+hi{x>10:R,a<4:A,m<9:lo2,A}
+lo2{s>2:A,R}
+
+{x=1,m=1,a=1,s=1}
+"""
+
+
+def test_day19_example():
+    day19 = load_day(19)
+    model = day19.parse(DAY19_EXAMPLE)
+    assert day19.part1(model) == 19114
+    assert day19.part2(model) == 167409079868000
+
+
+def test_day19_count_accepted_matches_brute_force():
+    day19 = load_day(19)
+    workflows, _ = day19.parse(DAY19_SMALL)
+    accepted = sum(
+        day19.Part.from_ratings(ratings).apply(workflows) == "A"
+        for ratings in product(range(1, 13), repeat=4)
+    )
+    assert day19.count_accepted(workflows, 1, 12) == accepted
+
+
+def test_day19_count_accepted_wide_bounds():
+    day19 = load_day(19)
+    workflows, _ = day19.parse(b"in{x>5000:A,m<100000:R,A}\n\n{x=1,m=1,a=1,s=1}")
+    high = 10**6
+    rejected = 5000 * 99999 * high * high
+    assert day19.count_accepted(workflows, 1, high) == high**4 - rejected
+
+
+def test_day19_incremental_edits_match_fresh_parse():
+    day19 = load_day(19)
+    system = day19.IncrementalSystem(*day19.parse(DAY19_EXAMPLE))
+    system.part1(), system.part2()
+    text = DAY19_EXAMPLE
+    edits = [
+        (b"hdj{m>838:A,pv}", b"hdj{m>1000:pv,A}", {"hdj", "qqz", "in"}),
+        (b"pv{a>1716:R,A}", b"pv{a>100:A,R}", {"pv", "hdj", "qqz", "in"}),
+    ]
+    for old, new, upstream in edits:
+        text = text.replace(old, new)
+        assert system.edit(new.decode()) == upstream
+        fresh = day19.parse(text)
+        assert system.part1() == day19.part1(fresh)
+        assert system.part2() == day19.part2(fresh)
+
+
+def scratchcard(number, matches):
+    draw = list(range(1, matches + 1)) + list(range(50, 60 - matches))
+    return f"Card {number}: {' '.join(map(str, range(1, 11)))} | {' '.join(map(str, draw))}"
+
+
+def test_day04_stream_matches_parts():
+    day04 = load_day(4)
+    matches = [0, 1, 2, 10, 0, 2, 1, 10, 3, 0, 5, 0] + [0] * 10
+    lines = [scratchcard(i, m) for i, m in enumerate(matches, 1)]
+    lines = day04.parse("\n".join(lines).encode())
+    assert day04.stream(lines) == (day04.part1(lines), day04.part2(lines))
+
+
+def test_day07_external_sort_matches_parts(monkeypatch):
+    day07 = load_day(7)
+    monkeypatch.setattr(day07, "MERGE_FAN_IN", 3)
+    data = generate("07", 500, seed=0)
+    model = day07.parse(data)
+    lines = data.decode().splitlines()
+    assert day07.stream(lines, run_size=7) == (day07.part1(model), day07.part2(model))